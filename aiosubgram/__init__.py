@@ -1,3 +1,14 @@
-from .client import SubgramClient
+from typing import TYPE_CHECKING
 
-__all__ = ["SubgramClient"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+__all__ = ["SubgramClient"]
+
+
+def __getattr__(name: str):
+    # SubgramClient (aiohttp, модели) загружается при первом обращении.
+    if name == "SubgramClient":
+        from .client import SubgramClient
+        return SubgramClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,158 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("aiosubgram.analytics requires numpy: pip install numpy") from None
+
+from .cache import UserInfoCache, UserRecord
+from .types.publisher import UserInfo
+
+CATEGORICAL_FIELDS = ("gender", "country", "city", "device_type", "device_os", "lang_code", "age_category")
+"""Поля UserInfo, хранящиеся в AudienceFrame как категориальные коды."""
+
+
+class _Categories(dict):
+    """Словарь значение -> код, назначающий новым значениям следующий код."""
+
+    def __missing__(self, value: Any) -> int:
+        code = self[value] = len(self)
+        return code
+
+
+class AudienceFrame:
+    """
+    Колоночное представление набора UserInfo для быстрой агрегации.
+    Каждое категориальное поле хранится как массив кодов (int32) и список категорий,
+    `is_suspicious` - как булев массив. Распределения, кросс-таблицы и фильтры
+    считаются векторно (np.bincount, маски), без циклов по объектам.
+    """
+
+    def __init__(self, codes: Dict[str, np.ndarray], categories: Dict[str, List[Any]],
+                 is_suspicious: np.ndarray, user_ids: Optional[np.ndarray] = None):
+        self.codes = codes
+        """Коды категорий по полям."""
+
+        self.categories = categories
+        """Значения категорий по полям (индекс = код)."""
+
+        self.is_suspicious = is_suspicious
+        self.user_ids = user_ids
+
+    @classmethod
+    def from_records(cls, records: Iterable[Union[UserInfo, UserRecord]],
+                     user_ids: Optional[Iterable[int]] = None) -> "AudienceFrame":
+        """
+        Строит таблицу из объектов UserInfo или UserRecord.
+
+        Args:
+            records: Записи пользователей.
+            user_ids: ID пользователей в том же порядке (опционально).
+        """
+        rows = list(map(attrgetter(*CATEGORICAL_FIELDS, "is_suspicious"), records))
+        columns = list(zip(*rows)) if rows else [()] * (len(CATEGORICAL_FIELDS) + 1)
+        codes, categories = {}, {}
+        for field, column in zip(CATEGORICAL_FIELDS, columns):
+            index = _Categories()
+            codes[field] = np.fromiter(map(index.__getitem__, column), dtype=np.int32, count=len(column))
+            categories[field] = list(index)
+        is_suspicious = np.fromiter(columns[-1], dtype=bool, count=len(rows))
+        ids = np.fromiter(user_ids, dtype=np.int64) if user_ids is not None else None
+        return cls(codes, categories, is_suspicious, ids)
+
+    @classmethod
+    def from_cache(cls, cache: UserInfoCache) -> "AudienceFrame":
+        """Строит таблицу из актуальных записей UserInfoCache."""
+        items = list(cache.records())
+        return cls.from_records((record for _, record in items), (user_id for user_id, _ in items))
+
+    def __len__(self) -> int:
+        return len(self.is_suspicious)
+
+    def _code_of(self, field: str, value: Any) -> int:
+        try:
+            return self.categories[field].index(value)
+        except ValueError:
+            return -1
+
+    def mask(self, **conditions: Any) -> np.ndarray:
+        """
+        Возвращает булеву маску строк, удовлетворяющих всем условиям.
+        Значение условия - одно значение или список допустимых значений,
+        например `mask(country="Russia", age_category=[5, 6], is_suspicious=False)`.
+        """
+        result = np.ones(len(self), dtype=bool)
+        for field, expected in conditions.items():
+            if field == "is_suspicious":
+                result &= self.is_suspicious == bool(expected)
+                continue
+            values = expected if isinstance(expected, (list, tuple, set, frozenset)) else [expected]
+            wanted = [code for code in (self._code_of(field, value) for value in values) if code >= 0]
+            result &= np.isin(self.codes[field], wanted)
+        return result
+
+    def filter(self, mask: Optional[np.ndarray] = None, **conditions: Any) -> "AudienceFrame":
+        """Возвращает подмножество строк по маске и/или условиям (см. mask)."""
+        if mask is None:
+            mask = self.mask(**conditions)
+        elif conditions:
+            mask = mask & self.mask(**conditions)
+        return type(self)(
+            {field: codes[mask] for field, codes in self.codes.items()},
+            self.categories,
+            self.is_suspicious[mask],
+            self.user_ids[mask] if self.user_ids is not None else None
+        )
+
+    def distribution(self, field: str, normalize: bool = False) -> Dict[Any, float]:
+        """
+        Распределение значений поля, отсортированное по убыванию.
+
+        Args:
+            field: Поле (gender, country, city, device_type, device_os, lang_code, age_category).
+            normalize: Вернуть доли вместо количеств.
+        """
+        counts = np.bincount(self.codes[field], minlength=len(self.categories[field]))
+        order = np.argsort(-counts, kind="stable")
+        total = counts.sum() if normalize and len(self) else 1
+        return {
+            self.categories[field][code]: (float(counts[code] / total) if normalize else int(counts[code]))
+            for code in order if counts[code]
+        }
+
+    def suspicious_rate(self) -> float:
+        """Доля пользователей с признаком is_suspicious."""
+        return float(self.is_suspicious.mean()) if len(self) else 0.0
+
+    def suspicious_rate_by(self, field: str) -> Dict[Any, float]:
+        """Доля is_suspicious в разрезе значений поля."""
+        size = len(self.categories[field])
+        totals = np.bincount(self.codes[field], minlength=size)
+        flagged = np.bincount(self.codes[field], weights=self.is_suspicious, minlength=size)
+        return {
+            self.categories[field][code]: float(flagged[code] / totals[code])
+            for code in range(size) if totals[code]
+        }
+
+    def crosstab(self, row_field: str, column_field: str) -> Tuple[List[Any], List[Any], np.ndarray]:
+        """
+        Кросс-таблица количества пользователей по двум полям.
+
+        Returns:
+            Tuple[List, List, np.ndarray]: Значения строк, значения столбцов и матрица количеств.
+        """
+        rows, columns = self.categories[row_field], self.categories[column_field]
+        combined = self.codes[row_field].astype(np.int64) * len(columns) + self.codes[column_field]
+        matrix = np.bincount(combined, minlength=len(rows) * len(columns)).reshape(len(rows), len(columns))
+        return list(rows), list(columns), matrix
+
+    def to_dict(self, fields: Sequence[str] = CATEGORICAL_FIELDS) -> Dict[str, np.ndarray]:
+        """Декодирует поля в массивы значений (например, для pandas.DataFrame)."""
+        result = {
+            field: np.asarray(self.categories[field], dtype=object)[self.codes[field]] for field in fields
+        }
+        result["is_suspicious"] = self.is_suspicious
+        if self.user_ids is not None:
+            result["user_id"] = self.user_ids
+        return result
\ No newline at end of file
@@ -1,9 +1,21 @@
-import aiohttp
 import asyncio
-from typing import Optional, Dict, Type, TypeVar
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Optional, Dict, Sequence, Tuple, Type, TypeVar, Union
 from enum import Enum
-from .exceptions import APIError, NetworkError, SubgramError, AuthError
+from .exceptions import (
+    AuthRejectedError, DecodeError, NetworkError, ServerError, SubgramError, AuthError, error_for_status
+)
+from .ratelimit import RateLimiter
+from .streaming import JsonPath, JsonPathScanner
+from .transport import AiohttpTransport, Transport, TransportResponse
 from .types.base import SubgramObject
+from .upstreams import UpstreamPool
+
+if TYPE_CHECKING:
+    import aiohttp
+    from .endpoints import Endpoint
+    from .watchers import BalanceWatcher
 
 T = TypeVar("T", bound=SubgramObject)
 
@@ -12,44 +24,206 @@ class KeyType(Enum):
     TOKEN = "token"
     BOT = "bot"
 
+_KEY_ATTRS = {KeyType.SECRET: "secret_key", KeyType.TOKEN: "api_token", KeyType.BOT: "api_key"}
+
 class BaseClient:
     API_URL = "https://api.subgram.org"
+    AUTH_REJECT_STATUSES = frozenset({401})
+    """Статусы, после которых ключ запоминается как отклоненный на `auth_cooldown`. 403 сюда не входит:
+    это может быть запрет на отдельный ресурс, а не отзыв ключа."""
+
+    _balance_watcher: Optional["BalanceWatcher"] = None
+    """Общий наблюдатель баланса клиента (см. BalanceWatcher.shared)."""
 
     def __init__(self, secret_key: Optional[str] = None, api_token: Optional[str] = None, api_key: Optional[str] = None,
-                 timeout: Optional[float] = 15.0):
+                 timeout: Optional[float] = 15.0, rate_limit: Optional[float] = None,
+                 transport: Optional[Transport] = None, auth_cooldown: float = 60.0,
+                 api_urls: Optional[Union[Sequence[str], UpstreamPool]] = None):
         self.secret_key = secret_key
         self.api_token = api_token
         self.api_key = api_key
         self.timeout = timeout
         if not any([secret_key, api_token, api_key]):
             raise AuthError()
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            )
-        return self._session
+        self._transport: Transport = transport if transport is not None else AiohttpTransport(timeout)
+        self._rate_limiter: Optional[RateLimiter] = RateLimiter(rate_limit) if rate_limit else None
+        self.filter_catalog = None
+        self._auth_headers: Dict[KeyType, Dict[str, str]] = {}
+        self._urls: Dict[str, Tuple[str, str]] = {}
+        self.auth_cooldown = auth_cooldown
+        self._rejected: Dict[KeyType, Tuple[str, float, AuthRejectedError]] = {}
+        if api_urls is not None and not isinstance(api_urls, UpstreamPool):
+            api_urls = UpstreamPool(api_urls)
+        self.upstreams: Optional[UpstreamPool] = api_urls
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    async def get_session(self) -> "aiohttp.ClientSession":
+        if not isinstance(self._transport, AiohttpTransport):
+            raise SubgramError("get_session is only available with AiohttpTransport")
+        return await self._transport.get_session()
     
     async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        await self._transport.close()
 
     def _get_auth_header(self, key_type: KeyType) -> Dict[str, str]:
-        key = None
-        
-        if key_type == KeyType.SECRET:
-            key = self.secret_key
-        elif key_type == KeyType.TOKEN:
-            key = self.api_token
-        elif key_type == KeyType.BOT:
-            key = self.api_key
+        key = getattr(self, _KEY_ATTRS[key_type])
             
         if not key:
             raise SubgramError(f"API Key of type '{key_type.value}' is not provided but required for this request.")
 
-        return {"Auth": key}
+        # Заголовок строится один раз на ключ и пересоздается, только если ключ заменили.
+        headers = self._auth_headers.get(key_type)
+        if headers is None or headers["Auth"] is not key:
+            headers = self._auth_headers[key_type] = {"Auth": key}
+        return headers
+
+    def _url(self, endpoint: str) -> str:
+        base = self.API_URL
+        cached = self._urls.get(endpoint)
+        if cached is None or cached[0] is not base:
+            cached = self._urls[endpoint] = (base, f"{base}/{endpoint}")
+        return cached[1]
+
+    def _check_rejected(self, key_type: KeyType, key: str) -> None:
+        """Отклоненный API ключ не отправляется повторно до конца `auth_cooldown`."""
+        rejected = self._rejected.get(key_type)
+        if rejected is None:
+            return
+        rejected_key, until, error = rejected
+        if rejected_key != key or time.monotonic() >= until:
+            del self._rejected[key_type]
+            return
+        raise AuthRejectedError(error.status_code, error.message, error.code, error.data, local=True)
+
+    def _reject(self, key_type: KeyType, key: str, error: AuthRejectedError) -> None:
+        if self.auth_cooldown > 0 and error.status_code in self.AUTH_REJECT_STATUSES:
+            self._rejected[key_type] = (key, time.monotonic() + self.auth_cooldown, error)
+
+    async def _read_json(self, response: TransportResponse) -> Any:
+        """Разбирает ответ; ответы с ошибкой переводит в типизированные исключения (см. error_for_status)."""
+        try:
+            data = await response.json()
+        except DecodeError as e:
+            if response.status < 400:
+                raise
+            data = e.data
+
+        if response.status >= 400 and (not isinstance(data, dict) or data.get("status", "error") == "error"):
+            raise error_for_status(response.status, data, response.headers.get("Retry-After"))
+        return data
+
+    @asynccontextmanager
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        json: Optional[Dict],
+        headers: Dict[str, str],
+        idempotent: bool
+    ) -> AsyncIterator[TransportResponse]:
+        """
+        Отправляет запрос на API_URL или, если задан пул `upstreams`, на лучший адрес пула.
+        При сетевой ошибке, таймауте или 5xx адрес получает штраф, а идемпотентный запрос
+        повторяется на следующем адресе. Ответ 2xx/4xx передается вызывающему коду без чтения тела
+        (чтобы не мешать потоковому разбору) и не повторяется: если его тело окажется не JSON,
+        адрес получит штраф, а вызывающий код - DecodeError.
+        """
+        if self.upstreams is None:
+            async with self._transport.request(method, self._url(endpoint), params=params, json=json,
+                                               headers=headers) as response:
+                yield response
+            return
+
+        candidates = self.upstreams.candidates()
+        for attempt, upstream in enumerate(candidates):
+            started = time.monotonic()
+            delivered = False
+            try:
+                async with self._transport.request(method, upstream.url_for(endpoint), params=params, json=json,
+                                                   headers=headers) as response:
+                    if response.status >= 500:
+                        await self._read_json(response)
+                    self.upstreams.record_success(upstream, time.monotonic() - started)
+                    delivered = True
+                    yield response
+                    return
+            except (NetworkError, ServerError, DecodeError, asyncio.TimeoutError):
+                if delivered:
+                    # Ошибка при чтении тела, уже переданного вызывающему коду.
+                    self.upstreams.record_failure(upstream)
+                    raise
+                self.upstreams.record_failure(upstream)
+                if not idempotent or attempt == len(candidates) - 1:
+                    raise
+
+    async def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        key_type: KeyType = KeyType.SECRET,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        idempotent: bool = False
+    ) -> Any:
+        """
+        Выполняет запрос и возвращает разобранный JSON без валидации моделью.
+        `idempotent` разрешает повтор на другом адресе пула `upstreams` при сбое.
+        """
+        headers = self._get_auth_header(key_type)
+        self._check_rejected(key_type, headers["Auth"])
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        try:
+            async with self._send(method, endpoint, params, json, headers, idempotent) as response:
+                return await self._read_json(response)
+        except AuthRejectedError as e:
+            self._reject(key_type, headers["Auth"], e)
+            raise
+
+    async def _iter_json(
+        self,
+        method: str,
+        endpoint: str,
+        paths: Collection[JsonPath],
+        key_type: KeyType = KeyType.SECRET,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        chunk_size: int = 65536,
+        idempotent: bool = False
+    ) -> AsyncIterator[Tuple[JsonPath, Any]]:
+        """Выполняет запрос и выдает значения по путям `paths` по мере чтения тела ответа (см. JsonPathScanner)."""
+        headers = self._get_auth_header(key_type)
+        self._check_rejected(key_type, headers["Auth"])
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        async with self._send(method, endpoint, params, json, headers, idempotent) as response:
+            if response.status >= 400:
+                try:
+                    await self._read_json(response)
+                except AuthRejectedError as e:
+                    self._reject(key_type, headers["Auth"], e)
+                    raise
+
+            scanner = JsonPathScanner(paths)
+            async for chunk in response.iter_chunks(chunk_size):
+                try:
+                    items = scanner.feed(chunk)
+                except ValueError as e:
+                    raise DecodeError(response.status, f"Streamed response is not valid JSON: {e}") from None
+                for item in items:
+                    yield item
+            try:
+                scanner.close()
+            except ValueError as e:
+                raise DecodeError(response.status, f"Streamed response is not valid JSON: {e}") from None
 
     async def _make_request(
         self, 
@@ -58,21 +232,21 @@ class BaseClient:
         response_model: Type[T],
         key_type: KeyType = KeyType.SECRET,
         params: Optional[Dict] = None,
-        json: Optional[Dict] = None
+        json: Optional[Dict] = None,
+        idempotent: bool = False
     ) -> T:
-        session = await self.get_session()
-        url = f"{self.API_URL}/{endpoint}"
-        
-        headers = self._get_auth_header(key_type)
+        data = await self._request_json(method, endpoint, key_type, params, json, idempotent)
+        return response_model.model_validate(data)
 
-        try:
-            async with session.request(method, url, params=params, json=json, headers=headers) as response:
-                data = await response.json()
-                
-                if response.status >= 400 and data["status"] == "error":
-                    raise APIError(response.status, f"API Subgram Error: {data}")
-                
-                return response_model.model_validate(data)
-                
-        except aiohttp.ClientError as e:
-            raise NetworkError(f"Network error occurred: {e}")
\ No newline at end of file
+    async def _call(self, endpoint: "Endpoint", **values: Any) -> Any:
+        """Выполняет метод API по описанию из реестра (aiosubgram.endpoints)."""
+        body = endpoint.encode(**values)
+        if endpoint.location == "params":
+            params, json = body, None
+        else:
+            # Методы без полей (get_balance, get_filters) отправляются без тела, как и раньше.
+            params, json = None, body if body or endpoint.fields else None
+        if endpoint.token_param and self.api_token is not None:
+            params = {"api_token": self.api_token, **(params or {})}
+        return await self._make_request(endpoint.method, endpoint.path, endpoint.response_model, endpoint.key_type,
+                                        params, json, endpoint.idempotent)
\ No newline at end of file
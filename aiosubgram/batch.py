@@ -0,0 +1,110 @@
+import asyncio
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, Optional, TypeVar, Union
+)
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+@dataclass
+class BatchResult(Generic[K, R]):
+    """Результат одного элемента пакетной операции."""
+
+    index: int
+    """Порядковый номер элемента во входной последовательности."""
+
+    key: K
+    """Входной элемент (например, ID пользователя или заказа)."""
+
+    result: Optional[R] = None
+    """Ответ API, если запрос завершился успешно."""
+
+    error: Optional[BaseException] = None
+    """Исключение, если запрос завершился ошибкой."""
+
+    checkpoint: int = 0
+    """
+    Все элементы с индексом меньше checkpoint уже выданы.
+    Передайте это значение в `start`, чтобы продолжить обработку после перезапуска.
+    """
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def iter_batch(
+    func: Callable[[K], Awaitable[R]],
+    items: Union[Iterable[K], AsyncIterable[K]],
+    concurrency: int = 10,
+    start: int = 0
+) -> AsyncIterator[BatchResult[K, R]]:
+    """
+    Выполняет `func` для каждого элемента `items`, держа в работе не более `concurrency` запросов,
+    и выдает результаты по мере завершения. Входная последовательность читается лениво,
+    поэтому потребление памяти не зависит от ее длины.
+
+    Args:
+        func: Корутинная функция, вызываемая для каждого элемента.
+        items: Итерируемый или асинхронно итерируемый источник элементов.
+        concurrency: Максимальное количество одновременных запросов.
+        start: Количество элементов, которые нужно пропустить (checkpoint предыдущего запуска).
+
+    Yields:
+        BatchResult: Результат или ошибка для каждого элемента.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if isinstance(items, AsyncIterable):
+        iterator: Any = items.__aiter__()
+        is_async = True
+    else:
+        iterator = iter(items)
+        is_async = False
+
+    async def next_item():
+        if is_async:
+            return await iterator.__anext__()
+        try:
+            return next(iterator)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    index = 0
+    exhausted = False
+    tasks: Dict[asyncio.Task, int] = {}
+    keys: Dict[int, K] = {}
+
+    try:
+        while True:
+            while not exhausted and len(tasks) < concurrency:
+                try:
+                    item = await next_item()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                if index >= start:
+                    tasks[asyncio.ensure_future(func(item))] = index
+                    keys[index] = item
+                index += 1
+
+            if not tasks:
+                return
+
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.__getitem__):
+                task_index = tasks.pop(task)
+                key = keys.pop(task_index)
+                checkpoint = min(tasks.values()) if tasks else index
+                if task.exception() is not None:
+                    yield BatchResult(task_index, key, error=task.exception(), checkpoint=checkpoint)
+                else:
+                    yield BatchResult(task_index, key, result=task.result(), checkpoint=checkpoint)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
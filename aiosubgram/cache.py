@@ -0,0 +1,184 @@
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
+
+from .types.publisher import GetSponsors, UserInfo
+
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+
+class SponsorsCache:
+    """
+    Кеш ответов get_sponsors (ОП) по ID пользователя с ограниченным временем жизни.
+    Хранит не более `max_size` записей, самые старые вытесняются первыми.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 100_000):
+        """
+        Args:
+            ttl (float): Время жизни записи в секундах. По умолчанию: 60.
+            max_size (int): Максимальное количество записей. По умолчанию: 100000.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: "OrderedDict[int, Tuple[float, GetSponsors]]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[GetSponsors]:
+        """Возвращает сохраненный ответ для пользователя или None, если записи нет или она устарела."""
+        item = self._data.get(user_id)
+        if item is None:
+            return None
+        expires_at, response = item
+        if expires_at < time.monotonic():
+            del self._data[user_id]
+            return None
+        return response
+
+    def set(self, user_id: int, response: GetSponsors) -> None:
+        """Сохраняет ответ get_sponsors для пользователя."""
+        self._data[user_id] = (time.monotonic() + self.ttl, response)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Удаляет запись пользователя (например, после нажатия «Я подписался»)."""
+        self._data.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Очищает кеш."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, user_id: int) -> bool:
+        return self.get(user_id) is not None
+
+
+class UserRecord:
+    """
+    Компактная запись UserInfo: поля в __slots__, категориальные строки интернированы
+    (одна копия строки "Russia" или "Android" на весь кеш).
+    """
+
+    __slots__ = (
+        "first_name", "last_name", "username", "lang_code", "age_category", "age_category_info",
+        "gender", "country", "city", "device_type", "device_os", "ip_address", "is_suspicious", "expires_at",
+    )
+
+    CATEGORICAL = ("lang_code", "age_category_info", "gender", "country", "city", "device_type", "device_os")
+    """Поля, значения которых интернируются."""
+
+    def __init__(self, info: UserInfo, expires_at: float):
+        for name in self.__slots__[:-1]:
+            value = getattr(info, name)
+            if name in self.CATEGORICAL and value is not None:
+                value = sys.intern(value)
+            setattr(self, name, value)
+        self.expires_at = expires_at
+
+    def to_user_info(self) -> UserInfo:
+        """Восстанавливает UserInfo без повторной валидации."""
+        return UserInfo.model_construct(**{name: getattr(self, name) for name in self.__slots__[:-1]})
+
+
+class UserInfoCache:
+    """
+    LRU-кеш демографии пользователей (get_user_info) с ограниченным временем жизни.
+    Записи хранятся в компактном виде (UserRecord), повторный запрос для пользователя
+    из кеша не обращается к API, а одновременные запросы одного пользователя объединяются.
+    """
+
+    def __init__(self, client: Optional["SubgramClient"] = None, ttl: float = 86400.0, max_size: int = 1_000_000):
+        """
+        Args:
+            client (Optional[SubgramClient]): Клиент с `api_key` (нужен для fetch).
+            ttl (float): Время жизни записи в секундах. По умолчанию: 24 часа.
+            max_size (int): Максимальное количество пользователей. По умолчанию: 1000000.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[int, UserRecord]" = OrderedDict()
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    def get_record(self, user_id: int) -> Optional[UserRecord]:
+        """Возвращает компактную запись пользователя или None."""
+        record = self._data.get(user_id)
+        if record is None:
+            return None
+        if record.expires_at < time.monotonic():
+            del self._data[user_id]
+            return None
+        self._data.move_to_end(user_id)
+        return record
+
+    def get(self, user_id: int) -> Optional[UserInfo]:
+        """Возвращает UserInfo пользователя из кеша или None."""
+        record = self.get_record(user_id)
+        return record.to_user_info() if record is not None else None
+
+    def set(self, user_id: int, info: UserInfo) -> None:
+        """Сохраняет UserInfo пользователя."""
+        self._data[user_id] = UserRecord(info, time.monotonic() + self.ttl)
+        self._data.move_to_end(user_id)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def fetch(self, user_id: int) -> Optional[UserInfo]:
+        """
+        Возвращает UserInfo из кеша, а при его отсутствии запрашивает get_user_info.
+
+        Returns:
+            Optional[UserInfo]: Данные пользователя или None, если API не вернул данные.
+        """
+        record = self.get_record(user_id)
+        if record is not None:
+            self.hits += 1
+            return record.to_user_info()
+
+        self.misses += 1
+        pending = self._pending.get(user_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[user_id] = future
+        try:
+            response = await self.client.get_user_info(user_id)
+            info = response.data
+            if info is not None:
+                self.set(user_id, info)
+            future.set_result(info)
+            return info
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(user_id, None)
+
+    def records(self) -> Iterator[Tuple[int, UserRecord]]:
+        """Итерирует (user_id, UserRecord) по актуальным записям."""
+        now = time.monotonic()
+        for user_id, record in list(self._data.items()):
+            if record.expires_at >= now:
+                yield user_id, record
+
+    def invalidate(self, user_id: int) -> None:
+        self._data.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import Optional, Sequence, Union
 import asyncio
 from .base import BaseClient
+from .transport import Transport
+from .upstreams import UpstreamPool
 from .methods import APIMethods
 
 class SubgramClient(BaseClient, APIMethods):
@@ -9,7 +11,10 @@ class SubgramClient(BaseClient, APIMethods):
     Наследуется от BaseClient для доступа к _make_request.
     """
 
-    def __init__(self, secret_key: Optional[str] = None, api_token: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, api_token: Optional[str] = None, api_key: Optional[str] = None,
+                 timeout: Optional[float] = 15.0, rate_limit: Optional[float] = None,
+                 transport: Optional[Transport] = None, auth_cooldown: float = 60.0,
+                 api_urls: Optional[Union[Sequence[str], UpstreamPool]] = None):
         """
         Экземпляр клиента Subgram.
 
@@ -17,11 +22,18 @@ class SubgramClient(BaseClient, APIMethods):
             secret_key: Secret Key (для управления заказами/ботами).
             api_token: API Token (для статистики/баланса).
             api_key: API Key бота (для работы с подписками/спонсорами).
+            timeout: Таймаут запроса в секундах.
+            rate_limit: Максимум запросов в секунду от этого клиента (None - без ограничения).
+            transport: HTTP-транспорт (по умолчанию AiohttpTransport; HttpxTransport - HTTP/2).
+            auth_cooldown: Сколько секунд после отклонения ключа (401, см. AUTH_REJECT_STATUSES) запросы с ним
+                завершаются AuthRejectedError без обращения к API (0 - не запоминать).
+            api_urls: Несколько базовых адресов API (или общий UpstreamPool) вместо API_URL:
+                запросы идут на самый быстрый доступный адрес с переключением при сбоях.
         """
-        super().__init__(secret_key, api_token, api_key)
+        super().__init__(secret_key, api_token, api_key, timeout, rate_limit, transport, auth_cooldown, api_urls)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._session.close()
\ No newline at end of file
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,159 @@
+from datetime import date
+from typing import Any, Callable, Dict, Literal, Mapping, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from .base import KeyType
+from .types.advertiser import CreateOrder, OrderInfo
+from .types.base import SubgramObject
+from .types.general import GetBalance, GetFilters, GetStatistic, ToggleExclusion
+from .types.publisher import Bots, GetSponsors, GetUserInfo
+
+Coercion = Literal["int", "date", "model"]
+
+
+def _to_date(value: Any) -> Any:
+    return value.strftime("%Y-%m-%d") if isinstance(value, date) else value
+
+
+def _to_plain(value: Any) -> Any:
+    return value.model_dump(exclude_none=True) if isinstance(value, BaseModel) else value
+
+
+_COERCIONS = {"int": "int", "date": "_to_date", "model": "_to_plain"}
+
+
+def _compile_encoder(fields: Sequence[str], coerce: Mapping[str, Coercion],
+                     constants: Mapping[str, Any]) -> Callable[..., Dict[str, Any]]:
+    """
+    Генерирует функцию сборки тела запроса: без цикла по полям и промежуточного словаря,
+    поля со значением None пропускаются, приведение типов выполняется на месте.
+    """
+    lines = [f"def encode(*, {', '.join(f'{name}=None' for name in fields)}):" if fields else "def encode():",
+             f"    payload = {dict(constants)!r}"]
+    for name in fields:
+        value = f"{_COERCIONS[coerce[name]]}({name})" if name in coerce else name
+        lines.append(f"    if {name} is not None: payload[{name!r}] = {value}")
+    lines.append("    return payload")
+    namespace: Dict[str, Any] = {"_to_date": _to_date, "_to_plain": _to_plain}
+    exec("\n".join(lines), namespace)
+    return namespace["encode"]
+
+
+class Endpoint:
+    """
+    Описание метода API: путь, HTTP-метод, тип ключа, модель ответа и правила сборки запроса.
+    Тело запроса собирается заранее скомпилированной функцией `encode`.
+    """
+
+    __slots__ = ("name", "path", "method", "key_type", "response_model", "idempotent",
+                 "location", "token_param", "fields", "encode")
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        method: str,
+        key_type: KeyType,
+        response_model: Type[SubgramObject],
+        fields: Sequence[str] = (),
+        coerce: Optional[Mapping[str, Coercion]] = None,
+        constants: Optional[Mapping[str, Any]] = None,
+        idempotent: bool = False,
+        location: Literal["json", "params"] = "json",
+        token_param: bool = False
+    ):
+        """
+        Args:
+            name: Имя в реестре (обычно имя метода клиента).
+            path: Путь относительно API_URL.
+            method: HTTP-метод.
+            key_type: Ключ авторизации.
+            response_model: Модель ответа.
+            fields: Поля запроса.
+            coerce: Приведение полей: "int" (bool -> 0/1), "date" (date -> YYYY-MM-DD), "model" (модель -> dict).
+            constants: Постоянные поля (например, {"action": "create"}).
+            idempotent: Повтор запроса безопасен (чтение).
+            location: Куда помещаются поля: тело JSON или query-параметры.
+            token_param: Добавлять `api_token` в query-параметры.
+        """
+        self.name = name
+        self.path = path
+        self.method = method
+        self.key_type = key_type
+        self.response_model = response_model
+        self.idempotent = idempotent
+        self.location = location
+        self.token_param = token_param
+        self.fields = tuple(fields)
+        self.encode: Callable[..., Dict[str, Any]] = _compile_encoder(self.fields, coerce or {}, constants or {})
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.name!r}, {self.method} /{self.path})"
+
+
+_BOT_SETTINGS = (
+    "bot_token", "bot_id", "bot_name", "bot_nickname", "time_purge", "max_sponsors", "get_links", "show_quiz",
+    "gender_question", "age_question", "text_op", "image_op", "forbidden_themes", "is_on",
+)
+_BOT_FLAGS = {name: "int" for name in ("get_links", "show_quiz", "gender_question", "age_question", "is_on")}
+_ORDER_FIELDS = (
+    "link", "ads_type", "quantity_all", "name", "is_on", "in_archive", "quantity_day", "price", "price_premium",
+    "bot_token", "to_bot_member", "track_unsubscriptions", "is_lite", "sub_speed", "user_parameters",
+    "forbidden_themes", "order_schedule",
+)
+_ORDER_MODELS = {"user_parameters": "model", "order_schedule": "model"}
+_STATISTIC_FIELDS = ("action", "ads_id", "bot_id", "start_date", "end_date")
+_DATES = {"start_date": "date", "end_date": "date"}
+
+ENDPOINTS: Dict[str, Endpoint] = {endpoint.name: endpoint for endpoint in (
+    Endpoint(
+        "get_sponsors", "get-sponsors", "POST", KeyType.BOT, GetSponsors,
+        ("chat_id", "user_id", "first_name", "username", "language_code", "is_premium", "action",
+         "max_sponsors", "get_links", "exclude_resource_ids", "exclude_ads_ids"),
+        coerce={"get_links": "int"}, idempotent=True
+    ),
+    Endpoint(
+        "get_user_subscriptions", "get-user-subscriptions", "POST", KeyType.BOT, GetSponsors,
+        ("user_id", "links", "start_date", "end_date"), coerce=_DATES, idempotent=True
+    ),
+    Endpoint("get_user_info", "get-user-info", "POST", KeyType.BOT, GetUserInfo, ("user_id",), idempotent=True),
+    Endpoint("add_bot", "bots", "POST", KeyType.SECRET, Bots, _BOT_SETTINGS[:-1], _BOT_FLAGS, {"action": "add"}),
+    Endpoint("update", "bots", "POST", KeyType.SECRET, Bots, _BOT_SETTINGS, _BOT_FLAGS, {"action": "update"}),
+    Endpoint(
+        "get_bot_info", "bots", "POST", KeyType.SECRET, Bots, ("bot_id",), constants={"action": "info"},
+        idempotent=True
+    ),
+    Endpoint(
+        "create_order", "orders", "POST", KeyType.SECRET, CreateOrder,
+        tuple(name for name in _ORDER_FIELDS if name != "in_archive"), _ORDER_MODELS, {"action": "create"}
+    ),
+    Endpoint(
+        "update_order", "orders", "POST", KeyType.SECRET, CreateOrder,
+        ("order_id",) + tuple(name for name in _ORDER_FIELDS if name != "ads_type"), _ORDER_MODELS,
+        {"action": "update"}
+    ),
+    Endpoint(
+        "get_order_info", "orders", "POST", KeyType.SECRET, OrderInfo, ("order_id",),
+        constants={"action": "info"}, idempotent=True
+    ),
+    Endpoint("get_balance", "get-balance", "POST", KeyType.TOKEN, GetBalance, idempotent=True),
+    Endpoint("get_filters", "filters", "GET", KeyType.TOKEN, GetFilters, idempotent=True),
+    Endpoint(
+        "get_statistic", "statistic", "GET", KeyType.TOKEN, GetStatistic, _STATISTIC_FIELDS, _DATES,
+        {"output_format": "json"}, idempotent=True, location="params", token_param=True
+    ),
+    Endpoint(
+        "toggle_exclusion", "toggle-exclusion", "POST", KeyType.TOKEN, ToggleExclusion,
+        ("action", "context", "ads_id", "bot_id"), token_param=True
+    ),
+)}
+"""Реестр методов API по имени."""
+
+
+def endpoint_for(path: str) -> Optional[Endpoint]:
+    """Первое описание метода с указанным путем (для путей, общих для нескольких методов, - любое из них)."""
+    for endpoint in ENDPOINTS.values():
+        if endpoint.path == path:
+            return endpoint
+    return None
\ No newline at end of file
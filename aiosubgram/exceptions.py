@@ -1,19 +1,104 @@
+from typing import Any, Optional
+
+
 class SubgramError(Exception):
     """Base class for exceptions in this module."""
-    pass
+    retryable: bool = False
+    """Whether repeating the same request may succeed."""
 
 class APIError(SubgramError):
     """Exception raised for API errors."""
-    def __init__(self, status_code: int, message: str):
+    status_code: int
+    """HTTP status of the response."""
+
+    message: str
+    """Error message from the response body."""
+
+    code: int
+    """Error code from the response body (HTTP status if the body has none)."""
+
+    data: Any
+    """Parsed response body (raw text if it is not JSON)."""
+
+    def __init__(self, status_code: int, message: str, code: Optional[int] = None, data: Any = None):
         self.status_code = status_code
         self.message = message
+        self.code = code if code is not None else status_code
+        self.data = data
         super().__init__(f"[{status_code}] {message}")
 
+class RateLimitError(APIError):
+    """Exception raised when the API rejects a request as rate-limited (429)."""
+    retryable = True
+    retry_after: Optional[float]
+    """Delay suggested by the Retry-After header, in seconds."""
+
+    def __init__(self, status_code: int, message: str, code: Optional[int] = None, data: Any = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(status_code, message, code, data)
+        self.retry_after = retry_after
+
+class AuthRejectedError(APIError):
+    """Exception raised when the API rejects the key (401) or denies access (403)."""
+    local: bool
+    """True if the request was not sent because the key is in its rejection cool-down."""
+
+    def __init__(self, status_code: int, message: str, code: Optional[int] = None, data: Any = None,
+                 local: bool = False):
+        super().__init__(status_code, message, code, data)
+        self.local = local
+
+class RequestValidationError(APIError):
+    """Exception raised when the API rejects request parameters (other 4xx)."""
+    pass
+
+class ServerError(APIError):
+    """Exception raised for API server errors (5xx)."""
+    retryable = True
+
+class DecodeError(APIError):
+    """Exception raised when a response body is not valid JSON."""
+    pass
+
 class NetworkError(SubgramError):
     """Exception raised for network errors."""
-    pass
+    retryable = True
 
 class AuthError(SubgramError):
     """Exception raised for authentication errors."""
     def __init__(self):
-        super().__init__("API keys are not provided or invalid.")
\ No newline at end of file
+        super().__init__("API keys are not provided or invalid.")
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def error_for_status(status_code: int, data: Any = None, retry_after: Optional[str] = None) -> APIError:
+    """
+    Builds the typed exception for an error response.
+
+    Args:
+        status_code: HTTP status.
+        data: Parsed JSON body or raw text.
+        retry_after: Value of the Retry-After header.
+    """
+    if isinstance(data, dict):
+        message = str(data.get("message") or data)
+        code = data.get("code")
+        code = code if isinstance(code, int) else None
+    else:
+        message = str(data)[:200] if data else "Empty response"
+        code = None
+    message = f"API Subgram Error: {message}"
+
+    if status_code == 429:
+        return RateLimitError(status_code, message, code, data, _parse_retry_after(retry_after))
+    if status_code in (401, 403):
+        return AuthRejectedError(status_code, message, code, data)
+    if status_code >= 500:
+        return ServerError(status_code, message, code, data)
+    return RequestValidationError(status_code, message, code, data)
\ No newline at end of file
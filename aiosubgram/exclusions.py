@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, List, Literal, Optional, Tuple, Union
+
+from .batch import BatchResult
+from .types.general import TableDataItem, ToggleExclusion
+
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+
+@dataclass(frozen=True)
+class ExclusionEntry:
+    """Одна операция toggle_exclusion."""
+
+    action: Literal["exclude", "activate"]
+    context: Literal["advertiser", "publisher"]
+    ads_id: int
+    bot_id: Optional[int] = None
+    is_excluded: Optional[bool] = None
+    """Текущее состояние (TableDataItem.is_excluded), если известно."""
+
+    @property
+    def key(self) -> Tuple[int, Optional[int], str]:
+        return self.ads_id, self.bot_id, self.context
+
+    @property
+    def needed(self) -> bool:
+        """False, если текущее состояние уже совпадает с желаемым."""
+        if self.is_excluded is None:
+            return True
+        return self.is_excluded != (self.action == "exclude")
+
+
+def dedup_exclusions(entries: Iterable[ExclusionEntry]) -> List[ExclusionEntry]:
+    """
+    Убирает повторы по (ads_id, bot_id, context) - остается последняя операция -
+    и операции, состояние которых уже совпадает с желаемым.
+    """
+    unique = {}
+    for entry in entries:
+        unique.pop(entry.key, None)
+        unique[entry.key] = entry
+    return [entry for entry in unique.values() if entry.needed]
+
+
+@dataclass
+class ExclusionPolicy:
+    """
+    Правило автоматического исключения по таблице статистики (action="sponsor" или "source").
+    Строка исключается, если доход на подписчика (`value / subscribers`) выходит за пороги,
+    и возвращается в работу, если снова в них укладывается.
+    """
+
+    min_value_per_subscriber: Optional[float] = None
+    """Исключать строки с доходом на подписчика ниже порога."""
+
+    max_value_per_subscriber: Optional[float] = None
+    """Исключать строки с доходом (расходом) на подписчика выше порога."""
+
+    min_subscribers: int = 10
+    """Строки с меньшим числом подписчиков не оцениваются (мало данных)."""
+
+    reactivate: bool = True
+    """Возвращать исключенные строки, которые укладываются в пороги."""
+
+    def evaluate(self, row: TableDataItem) -> Optional[bool]:
+        """
+        Returns:
+            Optional[bool]: True - исключить, False - оставить, None - недостаточно данных.
+        """
+        subscribers = row.subscribers or 0
+        if subscribers < max(self.min_subscribers, 1):
+            return None
+        per_subscriber = (row.value or 0.0) / subscribers
+        if self.min_value_per_subscriber is not None and per_subscriber < self.min_value_per_subscriber:
+            return True
+        if self.max_value_per_subscriber is not None and per_subscriber > self.max_value_per_subscriber:
+            return True
+        return False
+
+    def plan(
+        self,
+        rows: Iterable[TableDataItem],
+        action: Literal["sponsor", "source"],
+        ads_id: Optional[int] = None,
+        bot_id: Optional[int] = None
+    ) -> List[ExclusionEntry]:
+        """
+        Строит список операций по строкам таблицы.
+        Для action="sponsor" (владелец бота) исключаются спонсоры бота `bot_id`,
+        для action="source" (рекламодатель) - боты-источники заказа `ads_id`.
+        """
+        if action == "sponsor" and bot_id is None:
+            raise ValueError("bot_id is required for action 'sponsor'")
+        if action == "source" and ads_id is None:
+            raise ValueError("ads_id is required for action 'source'")
+
+        entries = []
+        for row in rows:
+            verdict = self.evaluate(row)
+            if verdict is None or (not verdict and not self.reactivate):
+                continue
+            if action == "sponsor":
+                if row.ads_id is None:
+                    continue
+                target = {"context": "publisher", "ads_id": row.ads_id, "bot_id": bot_id}
+            else:
+                if row.bot_id is None:
+                    continue
+                target = {"context": "advertiser", "ads_id": ads_id, "bot_id": row.bot_id}
+            entries.append(ExclusionEntry(
+                action="exclude" if verdict else "activate", is_excluded=row.is_excluded, **target
+            ))
+        return dedup_exclusions(entries)
+
+
+@dataclass
+class ExclusionReport:
+    """Результат применения ExclusionPolicy."""
+
+    planned: List[ExclusionEntry]
+    results: List[BatchResult[ExclusionEntry, ToggleExclusion]] = field(default_factory=list)
+
+    @property
+    def excluded(self) -> List[ExclusionEntry]:
+        return [item.key for item in self.results if item.ok and item.key.action == "exclude"]
+
+    @property
+    def activated(self) -> List[ExclusionEntry]:
+        return [item.key for item in self.results if item.ok and item.key.action == "activate"]
+
+    @property
+    def failed(self) -> List[BatchResult[ExclusionEntry, ToggleExclusion]]:
+        return [item for item in self.results if not item.ok]
+
+
+async def apply_exclusion_policy(
+    client: "SubgramClient",
+    policy: ExclusionPolicy,
+    action: Literal["sponsor", "source"],
+    ads_id: Optional[int] = None,
+    bot_id: Optional[int] = None,
+    start_date: Optional[Union[date, str]] = None,
+    end_date: Optional[Union[date, str]] = None,
+    concurrency: int = 10,
+    dry_run: bool = False
+) -> ExclusionReport:
+    """
+    Загружает таблицу статистики (потоково), строит список исключений по политике
+    и выполняет только необходимые вызовы toggle_exclusion.
+    Требует `api_token`.
+
+    Args:
+        client: Клиент с `api_token`.
+        policy: Пороговые правила.
+        action: "sponsor" (спонсоры бота `bot_id`) или "source" (боты-источники заказа `ads_id`).
+        ads_id: ID заказа (для action="source").
+        bot_id: ID бота (для action="sponsor").
+        start_date: Начальная дата периода оценки.
+        end_date: Конечная дата периода оценки.
+        concurrency: Максимум одновременных вызовов toggle_exclusion.
+        dry_run: Только построить план.
+
+    Returns:
+        ExclusionReport: План и результаты вызовов.
+    """
+    rows = [
+        row async for row in client.iter_statistic_table(action, ads_id, bot_id, start_date, end_date)
+    ]
+    report = ExclusionReport(policy.plan(rows, action, ads_id, bot_id))
+    if not dry_run:
+        async for item in client.iter_toggle_exclusion(report.planned, concurrency=concurrency):
+            report.results.append(item)
+    return report
\ No newline at end of file
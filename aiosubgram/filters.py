@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+from .types.advertiser import UserParameters
+from .types.general import FilterValue, GetFilters
+
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+logger = logging.getLogger(__name__)
+
+Section = Literal["ads", "bots"]
+
+USER_PARAMETER_GROUPS = ("languages", "countries", "cities", "devicestype", "devicesos", "ages")
+"""Поля UserParameters, значения которых проверяются по фильтрам рекламодателя."""
+
+
+class FilterCatalog:
+    """
+    Справочник фильтров (get_filters) с индексами по ID и по названию (без учета регистра).
+    Может храниться на диске и обновляться из API только по истечении TTL.
+    """
+
+    def __init__(self, filters: GetFilters, fetched_at: Optional[float] = None):
+        """
+        Args:
+            filters (GetFilters): Ответ метода get_filters.
+            fetched_at (Optional[float]): Время получения (unix time). По умолчанию: сейчас.
+        """
+        self.filters = filters
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._by_id: Dict[Tuple[str, str], Dict[str, FilterValue]] = {}
+        self._by_name: Dict[Tuple[str, str], Dict[str, FilterValue]] = {}
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        sections = self.filters.filters
+        if sections is None:
+            return
+        for section_name in ("ads", "bots"):
+            section = getattr(sections, section_name)
+            if section is None:
+                continue
+            for group, values in section:
+                if not values:
+                    continue
+                self._by_id[section_name, group] = {str(value.id): value for value in values}
+                self._by_name[section_name, group] = {value.name.casefold(): value for value in values}
+
+    @property
+    def digest(self) -> str:
+        """Хеш содержимого справочника (для определения изменений)."""
+        raw = json.dumps(self.filters.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at < ttl
+
+    def get(self, group: str, id: Union[int, str], section: Section = "ads") -> Optional[FilterValue]:
+        """Возвращает значение фильтра по ID (например, group="countries")."""
+        return self._by_id.get((section, group), {}).get(str(id))
+
+    def find(self, group: str, name: str, section: Section = "ads") -> Optional[FilterValue]:
+        """Возвращает значение фильтра по названию без учета регистра."""
+        return self._by_name.get((section, group), {}).get(name.casefold())
+
+    def name_of(self, group: str, id: Union[int, str], section: Section = "ads") -> Optional[str]:
+        """Название значения фильтра по ID."""
+        value = self.get(group, id, section)
+        return value.name if value else None
+
+    def id_of(self, group: str, name: str, section: Section = "ads") -> Optional[Union[int, str]]:
+        """ID значения фильтра по названию."""
+        value = self.find(group, name, section)
+        return value.id if value else None
+
+    def unknown(self, group: str, ids: Iterable[Union[int, str]], section: Section = "ads") -> List[Union[int, str]]:
+        """Возвращает ID, которых нет в справочнике. Если группы нет в справочнике, проверка не выполняется."""
+        index = self._by_id.get((section, group))
+        if index is None:
+            return []
+        return [id for id in ids if str(id) not in index]
+
+    def validate(
+        self,
+        user_parameters: Optional[Union[UserParameters, Dict]] = None,
+        forbidden_themes: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Проверяет параметры таргетинга и запрещенные тематики заказа по справочнику.
+
+        Raises:
+            ValueError: Если найдены ID, отсутствующие в справочнике.
+        """
+        if isinstance(user_parameters, dict):
+            user_parameters = UserParameters.model_validate(user_parameters)
+
+        errors = []
+        if user_parameters is not None:
+            for group in USER_PARAMETER_GROUPS:
+                values = getattr(user_parameters, group)
+                missing = self.unknown(group, values or ())
+                if missing:
+                    errors.append(f"{group}: {missing}")
+        if forbidden_themes:
+            missing = self.unknown("forbidden_themes", forbidden_themes)
+            if missing:
+                errors.append(f"forbidden_themes: {missing}")
+        if errors:
+            raise ValueError("Unknown filter values: " + "; ".join(errors))
+
+    def save(self, path: str) -> None:
+        """Сохраняет справочник на диск (атомарная запись)."""
+        payload = {"fetched_at": self.fetched_at, "filters": self.filters.model_dump(mode="json")}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_file(cls, path: str) -> "FilterCatalog":
+        """Загружает справочник с диска."""
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        return cls(GetFilters.model_validate(payload["filters"]), payload["fetched_at"])
+
+    @classmethod
+    async def load(cls, client: "SubgramClient", path: Optional[str] = None, ttl: float = 86400.0) -> "FilterCatalog":
+        """
+        Возвращает справочник: из файла, если он свежее `ttl`, иначе из API.
+        Если API недоступен, используется устаревшая копия с диска.
+
+        Args:
+            client: Экземпляр SubgramClient.
+            path: Путь к файлу кеша (None - без сохранения на диск).
+            ttl: Время жизни справочника в секундах. По умолчанию: 24 часа.
+
+        Returns:
+            FilterCatalog: Справочник фильтров.
+        """
+        cached = None
+        if path is not None and os.path.exists(path):
+            try:
+                cached = await asyncio.to_thread(cls.from_file, path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Failed to read filter catalog from %s: %s", path, e)
+        if cached is not None and cached.is_fresh(ttl):
+            return cached
+
+        try:
+            catalog = cls(await client.get_filters())
+        except Exception:
+            if cached is None:
+                raise
+            logger.warning("Failed to refresh filter catalog, using stale copy from %s", path)
+            return cached
+
+        if path is not None:
+            await asyncio.to_thread(catalog.save, path)
+        return catalog
+
+    async def refresh(self, client: "SubgramClient", path: Optional[str] = None) -> bool:
+        """
+        Перезапрашивает справочник из API и перестраивает индексы.
+
+        Returns:
+            bool: True, если содержимое изменилось.
+        """
+        fresh = type(self)(await client.get_filters())
+        changed = fresh.digest != self.digest
+        if changed:
+            self.filters, self._by_id, self._by_name = fresh.filters, fresh._by_id, fresh._by_name
+        self.fetched_at = fresh.fetched_at
+        if path is not None:
+            await asyncio.to_thread(self.save, path)
+        return changed
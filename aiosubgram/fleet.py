@@ -0,0 +1,183 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from .batch import iter_batch
+from .exceptions import SubgramError
+from .types.publisher import Bot, Bots
+
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+BOT_SETTINGS_FIELDS = (
+    "time_purge", "max_sponsors", "get_links", "show_quiz", "gender_question",
+    "age_question", "text_op", "image_op", "forbidden_themes", "is_on",
+)
+"""Настройки бота, которые можно синхронизировать через update."""
+
+BotSettings = Union[Mapping[str, Any], Bot]
+
+
+@dataclass
+class BotDiff:
+    """Расхождение текущих и желаемых настроек одного бота."""
+
+    bot_id: int
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+    """Поле -> (текущее значение, желаемое значение)."""
+
+    current: Optional[Bot] = None
+    """Текущие настройки из get_bot_info."""
+
+    result: Optional[Bots] = None
+    """Ответ update (после применения плана)."""
+
+    error: Optional[BaseException] = None
+    """Исключение при получении настроек или обновлении."""
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.changes)
+
+    @property
+    def desired(self) -> Dict[str, Any]:
+        """Поля, которые нужно отправить в update."""
+        return {name: new for name, (_, new) in self.changes.items()}
+
+
+@dataclass
+class FleetPlan:
+    """План синхронизации парка ботов и его результаты."""
+
+    diffs: List[BotDiff]
+    applied: bool = False
+
+    @property
+    def to_update(self) -> List[BotDiff]:
+        return [diff for diff in self.diffs if diff.error is None and diff.changed]
+
+    @property
+    def unchanged(self) -> List[BotDiff]:
+        return [diff for diff in self.diffs if diff.error is None and not diff.changed]
+
+    @property
+    def failed(self) -> List[BotDiff]:
+        return [diff for diff in self.diffs if diff.error is not None]
+
+
+def _settings(desired: BotSettings) -> Dict[str, Any]:
+    if isinstance(desired, Bot):
+        return {name: getattr(desired, name) for name in BOT_SETTINGS_FIELDS if name in desired.model_fields_set}
+    unknown = set(desired) - set(BOT_SETTINGS_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown bot settings: {sorted(unknown)}")
+    return dict(desired)
+
+
+def diff_bot(current: Bot, desired: BotSettings) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Сравнивает текущие настройки бота с желаемыми.
+    `forbidden_themes` сравниваются без учета порядка, поля со значением None не сравниваются.
+
+    Returns:
+        Dict[str, Tuple[Any, Any]]: Поле -> (текущее значение, желаемое значение).
+    """
+    changes = {}
+    for name, new in _settings(desired).items():
+        if new is None:
+            continue
+        old = getattr(current, name)
+        if name == "forbidden_themes":
+            same = set(old or ()) == set(new)
+        else:
+            same = old == new
+        if not same:
+            changes[name] = (old, new)
+    return changes
+
+
+async def plan_fleet(
+    client: "SubgramClient",
+    desired: Mapping[int, BotSettings],
+    concurrency: int = 10
+) -> FleetPlan:
+    """
+    Получает текущие настройки ботов (get_bot_info, параллельно) и строит план изменений.
+    Требует `secret_key`.
+
+    Args:
+        client: Клиент с `secret_key`.
+        desired: ID бота -> желаемые настройки (словарь полей из BOT_SETTINGS_FIELDS или Bot).
+        concurrency: Максимум одновременных запросов.
+
+    Returns:
+        FleetPlan: План (ошибки получения настроек сохраняются в `BotDiff.error`).
+    """
+    settings = {bot_id: _settings(value) for bot_id, value in desired.items()}
+    diffs = [BotDiff(bot_id) for bot_id in settings]
+
+    async def fetch(bot_id: int) -> Bot:
+        response = await client.get_bot_info(bot_id)
+        if not isinstance(response.result, Bot):
+            raise SubgramError(f"No settings returned for bot {bot_id}: {response.message}")
+        return response.result
+
+    async for item in iter_batch(fetch, list(settings), concurrency=concurrency):
+        diff = diffs[item.index]
+        if not item.ok:
+            diff.error = item.error
+            continue
+        diff.current = item.result
+        diff.changes = diff_bot(item.result, settings[diff.bot_id])
+    return FleetPlan(diffs)
+
+
+async def apply_fleet(client: "SubgramClient", plan: FleetPlan, concurrency: int = 10) -> FleetPlan:
+    """
+    Выполняет update только для ботов с расхождениями, отправляя лишь измененные поля.
+    Требует `secret_key`.
+
+    Args:
+        client: Клиент с `secret_key`.
+        plan: План из plan_fleet.
+        concurrency: Максимум одновременных запросов.
+
+    Returns:
+        FleetPlan: Тот же план с заполненными `result`/`error`.
+    """
+    pending = plan.to_update
+
+    async def update(diff: BotDiff) -> Bots:
+        return await client.update(bot_id=diff.bot_id, **diff.desired)
+
+    async for item in iter_batch(update, pending, concurrency=concurrency):
+        diff = pending[item.index]
+        if item.ok:
+            diff.result = item.result
+        else:
+            diff.error = item.error
+    plan.applied = True
+    return plan
+
+
+async def sync_fleet(
+    client: "SubgramClient",
+    desired: Mapping[int, BotSettings],
+    concurrency: int = 10,
+    dry_run: bool = False
+) -> FleetPlan:
+    """
+    Приводит настройки ботов к желаемым: plan_fleet, затем apply_fleet.
+
+    Args:
+        client: Клиент с `secret_key`.
+        desired: ID бота -> желаемые настройки.
+        concurrency: Максимум одновременных запросов.
+        dry_run: Только построить план, ничего не обновляя.
+
+    Returns:
+        FleetPlan: План и результаты обновления.
+    """
+    plan = await plan_fleet(client, desired, concurrency)
+    if dry_run:
+        return plan
+    return await apply_fleet(client, plan, concurrency)
\ No newline at end of file
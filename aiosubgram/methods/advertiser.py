@@ -1,12 +1,19 @@
-from typing import List, Optional, Literal, Dict, Union
+from typing import List, Optional, Literal, Dict, Union, Iterable, AsyncIterator
 from .base import MethodMixin
-from ..base import KeyType
+from ..endpoints import ENDPOINTS
+from ..batch import BatchResult, iter_batch
+from ..exceptions import APIError
 from ..types.advertiser import (
     CreateOrder,
     OrderInfo,
+    OrderInfoData,
     UserParameters,
     OrderSchedule
 )
+
+ORDER_DIFF_FIELDS = ("status", "quantity_now", "remains", "real_price")
+"""Поля OrderInfoData, изменение которых считается изменением заказа в iter_order_info."""
+
 class AdvertiserMethods(MethodMixin):
     async def create_order(
         self,
@@ -51,40 +58,30 @@ class AdvertiserMethods(MethodMixin):
 
         Returns:
             CreateOrder: Объект с ID созданного заказа.
+
+        Raises:
+            ValueError: Если у клиента задан `filter_catalog` и таргетинг содержит неизвестные ID.
         """
-        if isinstance(user_parameters, UserParameters):
-            user_parameters = user_parameters.model_dump(exclude_none=True)
-        if isinstance(order_schedule, OrderSchedule):
-            order_schedule = order_schedule.model_dump(exclude_none=True)
-
-        payload = {
-            "action": "create",
-            "link": link,
-            "ads_type": ads_type,
-            "quantity_all": quantity_all,
-            "name": name,
-            "is_on": is_on,
-            "quantity_day": quantity_day,
-            "price": price,
-            "price_premium": price_premium,
-            "bot_token": bot_token,
-            "to_bot_member": to_bot_member,
-            "track_unsubscriptions": track_unsubscriptions,
-            "is_lite": is_lite,
-            "sub_speed": sub_speed,
-            "user_parameters": user_parameters,
-            "forbidden_themes": forbidden_themes,
-            "order_schedule": order_schedule
-        }
-        
-        json_data = {k: v for k, v in payload.items() if v is not None}
-        
-        return await self._make_request(
-            method="POST",
-            endpoint="orders",
-            response_model=CreateOrder,
-            json=json_data,
-            key_type=KeyType.SECRET
+        if self.filter_catalog is not None:
+            self.filter_catalog.validate(user_parameters, forbidden_themes)
+        return await self._call(
+            ENDPOINTS["create_order"],
+            link=link,
+            ads_type=ads_type,
+            quantity_all=quantity_all,
+            name=name,
+            is_on=is_on,
+            quantity_day=quantity_day,
+            price=price,
+            price_premium=price_premium,
+            bot_token=bot_token,
+            to_bot_member=to_bot_member,
+            track_unsubscriptions=track_unsubscriptions,
+            is_lite=is_lite,
+            sub_speed=sub_speed,
+            user_parameters=user_parameters,
+            forbidden_themes=forbidden_themes,
+            order_schedule=order_schedule
         )
 
     async def update_order(
@@ -132,41 +129,31 @@ class AdvertiserMethods(MethodMixin):
             order_schedule: Расписание показов (OrderSchedule или dict).
         Returns:
             CreateOrder: Результат операции.
+
+        Raises:
+            ValueError: Если у клиента задан `filter_catalog` и таргетинг содержит неизвестные ID.
         """
-        if isinstance(user_parameters, UserParameters):
-            user_parameters = user_parameters.model_dump(exclude_none=True)
-        if isinstance(order_schedule, OrderSchedule):
-            order_schedule = order_schedule.model_dump(exclude_none=True)
-
-        payload = {
-            "action": "update",
-            "order_id": order_id,
-            "link": link,
-            "name": name,
-            "is_on": is_on,
-            "in_archive": in_archive,
-            "quantity_all": quantity_all,
-            "quantity_day": quantity_day,
-            "price": price,
-            "price_premium": price_premium,
-            "bot_token": bot_token,
-            "to_bot_member": to_bot_member,
-            "track_unsubscriptions": track_unsubscriptions,
-            "is_lite": is_lite,
-            "sub_speed": sub_speed,
-            "user_parameters": user_parameters,
-            "forbidden_themes": forbidden_themes,
-            "order_schedule": order_schedule
-        }
-
-        json_data = {k: v for k, v in payload.items() if v is not None}
-
-        return await self._make_request(
-            method="POST",
-            endpoint="orders",
-            response_model=CreateOrder,
-            json=json_data,
-            key_type=KeyType.SECRET
+        if self.filter_catalog is not None:
+            self.filter_catalog.validate(user_parameters, forbidden_themes)
+        return await self._call(
+            ENDPOINTS["update_order"],
+            order_id=order_id,
+            link=link,
+            name=name,
+            is_on=is_on,
+            in_archive=in_archive,
+            quantity_all=quantity_all,
+            quantity_day=quantity_day,
+            price=price,
+            price_premium=price_premium,
+            bot_token=bot_token,
+            to_bot_member=to_bot_member,
+            track_unsubscriptions=track_unsubscriptions,
+            is_lite=is_lite,
+            sub_speed=sub_speed,
+            user_parameters=user_parameters,
+            forbidden_themes=forbidden_themes,
+            order_schedule=order_schedule
         )
 
     async def get_order_info(self, order_id: int) -> OrderInfo:
@@ -180,15 +167,43 @@ class AdvertiserMethods(MethodMixin):
         Returns:
             OrderInfo: Полная информация о заказе.
         """
-        payload = {
-            "action": "info",
-            "order_id": order_id
-        }
-        
-        return await self._make_request(
-            method="POST",
-            endpoint="orders",
-            response_model=OrderInfo,
-            json=payload,
-            key_type=KeyType.SECRET
-        )
\ No newline at end of file
+        return await self._call(ENDPOINTS["get_order_info"], order_id=order_id)
+
+    async def iter_order_info(
+        self,
+        order_ids: Iterable[int],
+        concurrency: int = 10,
+        previous: Optional[Dict[int, OrderInfoData]] = None
+    ) -> AsyncIterator[BatchResult[int, OrderInfoData]]:
+        """
+        Получает информацию о множестве заказов параллельно (не более `concurrency` запросов одновременно).
+        Повторяющиеся ID запрашиваются один раз. Результаты выдаются по мере готовности.
+        Требует `secret_key`.
+
+        Если передан `previous` (снимок прошлого обновления: order_id -> OrderInfoData), выдаются только
+        новые заказы и заказы, у которых изменились `status`, `quantity_now`, `remains` или `real_price`,
+        а сам словарь обновляется на месте.
+
+        Args:
+            order_ids: ID заказов.
+            concurrency: Максимум одновременных запросов.
+            previous: Снимок предыдущего состояния для выдачи только изменений.
+
+        Yields:
+            BatchResult: `key` - ID заказа, `result` - OrderInfoData или `error` - исключение.
+        """
+        async def fetch(order_id: int) -> OrderInfoData:
+            info = await self.get_order_info(order_id)
+            if info.response is None:
+                raise APIError(info.code, f"API Subgram Error: {info.message}")
+            return info.response
+
+        async for item in iter_batch(fetch, dict.fromkeys(order_ids), concurrency=concurrency):
+            if previous is not None and item.ok:
+                old = previous.get(item.key)
+                previous[item.key] = item.result
+                if old is not None and all(
+                    getattr(old, field) == getattr(item.result, field) for field in ORDER_DIFF_FIELDS
+                ):
+                    continue
+            yield item
\ No newline at end of file
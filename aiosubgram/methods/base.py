@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, TypeVar, Type, Dict, Optional, Any
 
 if TYPE_CHECKING:
     from ..base import BaseClient, KeyType
+    from ..endpoints import Endpoint
     from ..types.base import SubgramObject
 
 T = TypeVar("T")
@@ -10,6 +11,11 @@ class MethodMixin:
     def __init__(self, *args, **kwargs):
         pass
     if TYPE_CHECKING:
+        filter_catalog: Any
+        api_token: Optional[str]
+
+        async def _call(self, endpoint: "Endpoint", **values: Any) -> Any: ...
+
         async def _make_request(
             self, 
             method: str, 
@@ -17,5 +23,27 @@ class MethodMixin:
             response_model: Type[Any],
             key_type: Any,
             params: Optional[Dict] = None,
-            json: Optional[Dict] = None
+            json: Optional[Dict] = None,
+            idempotent: bool = False
+        ) -> Any: ...
+
+        def _iter_json(
+            self,
+            method: str,
+            endpoint: str,
+            paths: Any,
+            key_type: Any,
+            params: Optional[Dict] = None,
+            json: Optional[Dict] = None,
+            idempotent: bool = False
+        ) -> Any: ...
+
+        async def _request_json(
+            self,
+            method: str,
+            endpoint: str,
+            key_type: Any,
+            params: Optional[Dict] = None,
+            json: Optional[Dict] = None,
+            idempotent: bool = False
         ) -> Any: ...
\ No newline at end of file
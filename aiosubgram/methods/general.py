@@ -1,11 +1,16 @@
-from typing import Optional, Literal, Union
+from typing import Any, AsyncIterator, Collection, Dict, Iterable, Optional, Literal, Tuple, Union
 from datetime import date
 from .base import MethodMixin
-from ..base import KeyType
+from ..endpoints import ENDPOINTS
+from ..batch import BatchResult, iter_batch
+from ..exclusions import ExclusionEntry, dedup_exclusions
+from ..streaming import STATISTIC_TABLE_PATH, JsonPath
+from ..stats.series import StatisticSeries, split_date_range
 from ..types.general import (
     GetBalance,
     GetFilters,
     GetStatistic,
+    TableDataItem,
     ToggleExclusion
 )
 
@@ -18,12 +23,7 @@ class GeneralMethods(MethodMixin):
         Returns:
             GetBalance: Баланс и список ботов с их доходом.
         """
-        return await self._make_request(
-        method="POST",
-        endpoint="get-balance",
-        response_model=GetBalance,
-        key_type=KeyType.TOKEN
-        )
+        return await self._call(ENDPOINTS["get_balance"])
     
     async def get_filters(self) -> GetFilters:
         """
@@ -33,12 +33,7 @@ class GeneralMethods(MethodMixin):
         Returns:
             GetFilters: Списки фильтров для рекламодателей и владельцев ботов.
         """
-        return await self._make_request(
-            method="GET",
-            endpoint="filters",
-            response_model=GetFilters,
-            key_type=KeyType.TOKEN
-        )
+        return await self._call(ENDPOINTS["get_filters"])
 
     async def get_statistic(
         self,
@@ -62,31 +57,120 @@ class GeneralMethods(MethodMixin):
         Returns:
             GetStatistic: Объект со статистическими данными (графики, таблицы).
         """
-        if isinstance(start_date, date):
-            start_date = start_date.strftime("%Y-%m-%d")
-        if isinstance(end_date, date):
-            end_date = end_date.strftime("%Y-%m-%d")
-
-        params = {
-            "api_token": self.api_token,
-            "action": action,
-            "ads_id": ads_id,
-            "bot_id": bot_id,
-            "start_date": start_date,
-            "end_date": end_date,
-            "output_format": "json"
-        }
-        
-        request_params = {k: v for k, v in params.items() if v is not None}
-
-        return await self._make_request(
-            method="GET",
-            endpoint="statistic",
-            response_model=GetStatistic,
-            params=request_params,
-            key_type=KeyType.TOKEN
+        return await self._call(
+            ENDPOINTS["get_statistic"],
+            action=action,
+            ads_id=ads_id,
+            bot_id=bot_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def _statistic_params(
+        self,
+        action: str,
+        ads_id: Optional[int] = None,
+        bot_id: Optional[int] = None,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None
+    ) -> Dict[str, Any]:
+        """Internal helper building query params for the statistic endpoint."""
+        params = ENDPOINTS["get_statistic"].encode(
+            action=action, ads_id=ads_id, bot_id=bot_id, start_date=start_date, end_date=end_date
+        )
+        if self.api_token is not None:
+            params["api_token"] = self.api_token
+        return params
+
+    def _iter_statistic(
+        self,
+        paths: Collection[JsonPath],
+        action: str,
+        ads_id: Optional[int] = None,
+        bot_id: Optional[int] = None,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None
+    ) -> AsyncIterator[Tuple[JsonPath, Any]]:
+        """Internal helper streaming selected parts of the statistic response, without building GetStatistic."""
+        endpoint = ENDPOINTS["get_statistic"]
+        return self._iter_json(
+            method=endpoint.method,
+            endpoint=endpoint.path,
+            paths=paths,
+            params=self._statistic_params(action, ads_id, bot_id, start_date, end_date),
+            key_type=endpoint.key_type,
+            idempotent=endpoint.idempotent
         )
 
+    async def iter_statistic_table(
+        self,
+        action: Literal["allads", "ads", "source", "allbots", "bots", "sponsor"],
+        ads_id: Optional[int] = None,
+        bot_id: Optional[int] = None,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None
+    ) -> AsyncIterator[TableDataItem]:
+        """
+        Потоковый вариант get_statistic для больших таблиц (action=source/sponsor).
+        Тело ответа разбирается по мере получения, строки `table_data` выдаются по одной,
+        поэтому потребление памяти не зависит от размера ответа.
+        Требует `api_token`.
+
+        Args:
+            action: Тип статистики (см. get_statistic).
+            ads_id: ID заказа (обязательно для actions: ads, source).
+            bot_id: ID бота (обязательно для actions: bots, sponsor).
+            start_date: Начальная дата (по умолч. 9 дней назад).
+            end_date: Конечная дата (по умолч. сегодня).
+
+        Yields:
+            TableDataItem: Строки таблицы статистики.
+        """
+        async for _, raw in self._iter_statistic(
+            [STATISTIC_TABLE_PATH], action, ads_id, bot_id, start_date, end_date
+        ):
+            yield TableDataItem.model_validate(raw)
+
+    async def get_statistic_range(
+        self,
+        action: Literal["allads", "ads", "source", "allbots", "bots", "sponsor"],
+        start_date: Union[date, str],
+        end_date: Optional[Union[date, str]] = None,
+        ads_id: Optional[int] = None,
+        bot_id: Optional[int] = None,
+        window_days: int = 31,
+        concurrency: int = 4
+    ) -> StatisticSeries:
+        """
+        Получает временной ряд статистики за длинный период.
+        Период делится на окна по `window_days` дней, окна запрашиваются параллельно,
+        а графики (`labels`, `subscribers_data`, `value_data`, `avg_price_data`) склеиваются в один ряд.
+        Требует `api_token`.
+
+        Args:
+            action: Тип статистики (см. get_statistic).
+            start_date: Начальная дата периода.
+            end_date: Конечная дата периода (по умолч. сегодня).
+            ads_id: ID заказа (обязательно для actions: ads, source).
+            bot_id: ID бота (обязательно для actions: bots, sponsor).
+            window_days: Длина одного окна в днях.
+            concurrency: Максимум одновременных запросов.
+
+        Returns:
+            StatisticSeries: Колоночный ряд статистики за весь период.
+        """
+        windows = split_date_range(start_date, end_date or date.today(), window_days)
+
+        async def fetch(window):
+            return await self.get_statistic(action, ads_id, bot_id, window[0], window[1])
+
+        parts = [None] * len(windows)
+        async for item in iter_batch(fetch, windows, concurrency=concurrency):
+            if not item.ok:
+                raise item.error
+            parts[item.index] = item.result.data
+        return StatisticSeries.from_data(parts)
+
     async def toggle_exclusion(
         self,
         action: Literal["exclude", "activate"],
@@ -107,24 +191,35 @@ class GeneralMethods(MethodMixin):
         Returns:
             ToggleExclusion: Статус операции.
         """
-        params = {
-            "api_token": self.api_token
-        }
-        
-        payload = {
-            "action": action,
-            "context": context,
-            "ads_id": ads_id,
-            "bot_id": bot_id
-        }
-        
-        json_data = {k: v for k, v in payload.items() if v is not None}
-
-        return await self._make_request(
-            method="POST",
-            endpoint="toggle-exclusion",
-            response_model=ToggleExclusion,
-            params=params,
-            json=json_data,
-            key_type=KeyType.TOKEN
-        )
\ No newline at end of file
+        return await self._call(
+            ENDPOINTS["toggle_exclusion"],
+            action=action,
+            context=context,
+            ads_id=ads_id,
+            bot_id=bot_id
+        )
+
+    async def iter_toggle_exclusion(
+        self,
+        entries: Iterable[ExclusionEntry],
+        concurrency: int = 10
+    ) -> AsyncIterator[BatchResult[ExclusionEntry, ToggleExclusion]]:
+        """
+        Пакетный вариант toggle_exclusion.
+        Повторы по (ads_id, bot_id, context) объединяются (остается последняя операция),
+        записи, у которых `is_excluded` уже совпадает с действием, пропускаются,
+        остальные вызовы выполняются параллельно (не более `concurrency`, с учетом rate_limit клиента).
+        Требует `api_token`.
+
+        Args:
+            entries: Операции (ExclusionEntry).
+            concurrency: Максимум одновременных запросов.
+
+        Yields:
+            BatchResult[ExclusionEntry, ToggleExclusion]: Результаты по мере готовности.
+        """
+        async def toggle(entry: ExclusionEntry) -> ToggleExclusion:
+            return await self.toggle_exclusion(entry.action, entry.context, entry.ads_id, entry.bot_id)
+
+        async for item in iter_batch(toggle, dedup_exclusions(entries), concurrency=concurrency):
+            yield item
\ No newline at end of file
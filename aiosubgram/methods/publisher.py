@@ -1,7 +1,8 @@
-from typing import List, Optional, Literal, Union
+from typing import List, Optional, Literal, Union, Iterable, AsyncIterable, AsyncIterator
 from datetime import date, datetime
 from .base import MethodMixin
-from ..base import KeyType
+from ..endpoints import ENDPOINTS
+from ..batch import BatchResult, iter_batch
 from ..types.publisher import GetSponsors, Bots, GetUserInfo
 
 class PublisherMethods(MethodMixin):
@@ -39,75 +40,19 @@ class PublisherMethods(MethodMixin):
         Returns:
             GetSponsors: Список спонсоров и статус.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "first_name": first_name,
-            "username": username,
-            "language_code": language_code,
-            "is_premium": is_premium,
-            "action": action,
-            "max_sponsors": max_sponsors,
-            "get_links": int(get_links) if get_links is not None else None,
-            "exclude_resource_ids": exclude_resource_ids,
-            "exclude_ads_ids": exclude_ads_ids,
-        }
-
-        json_data = {k: v for k, v in payload.items() if v is not None}
-
-        return await self._make_request(
-            method="POST",
-            endpoint="get-sponsors",
-            response_model=GetSponsors,
-            json=json_data,
-            key_type=KeyType.BOT
-        )
-    
-    async def _bots_action(
-        self,
-        action: Literal["add", "update, info"],
-        bot_token: Optional[str] = None,
-        bot_id: Optional[int] = None,
-        bot_name: Optional[str] = None,
-        bot_nickname: Optional[str] = None,
-        time_purge: Optional[int] = None,
-        max_sponsors: Optional[int] = None,
-        get_links: Optional[bool] = None,
-        show_quiz: Optional[bool] = None,
-        gender_question: Optional[bool] = None,
-        age_question: Optional[bool] = None,
-        text_op: Optional[str] = None,
-        image_op: Optional[str] = None,
-        forbidden_themes: List[str] = None,
-        is_on: Optional[bool] = None
-    ) -> Bots:
-        """Internal helper for bot management."""
-        if not any([bot_token, bot_id, bot_name, bot_nickname]):
-            raise ValueError("You must provide at least one of bot_token, bot_id, bot_name, bot_nickname")
-        payload = {
-            "action": action,
-            "bot_token": bot_token,
-            "bot_id": bot_id,
-            "bot_name": bot_name,
-            "bot_nickname": bot_nickname,
-            "time_purge": time_purge,
-            "max_sponsors": max_sponsors,
-            "get_links": int(get_links) if get_links is not None else None,
-            "show_quiz": int(show_quiz) if show_quiz is not None else None,
-            "gender_question": int(gender_question) if gender_question is not None else None,
-            "age_question": int(age_question) if age_question is not None else None,
-            "text_op": text_op,
-            "image_op": image_op,
-            "forbidden_themes": forbidden_themes,
-            "is_on": int(is_on) if is_on is not None else None
-        }
-        json_data = {k: v for k, v in payload.items() if v is not None}
-        return await self._make_request(
-            method="POST",
-            endpoint="bots",
-            response_model=Bots,
-            json=json_data,
-            key_type=KeyType.SECRET
+        return await self._call(
+            ENDPOINTS["get_sponsors"],
+            chat_id=chat_id,
+            user_id=user_id,
+            first_name=first_name,
+            username=username,
+            language_code=language_code,
+            is_premium=is_premium,
+            action=action,
+            max_sponsors=max_sponsors,
+            get_links=get_links,
+            exclude_resource_ids=exclude_resource_ids,
+            exclude_ads_ids=exclude_ads_ids
         )
     
     async def add_bot(
@@ -149,18 +94,18 @@ class PublisherMethods(MethodMixin):
         """
         if not any([bot_token, all([bot_id, bot_name, bot_nickname])]):
             raise ValueError("You must provide at least one of bot_token, bot_id, bot_name, bot_nickname")
-        return await self._bots_action(
-            action="add",
+        return await self._call(
+            ENDPOINTS["add_bot"],
             bot_token=bot_token,
             bot_id=bot_id,
             bot_name=bot_name,
             bot_nickname=bot_nickname,
             time_purge=time_purge,
             max_sponsors=max_sponsors,
-            get_links=int(get_links),
-            show_quiz=int(show_quiz),
-            gender_question=int(gender_question),
-            age_question=int(age_question),
+            get_links=get_links,
+            show_quiz=show_quiz,
+            gender_question=gender_question,
+            age_question=age_question,
             text_op=text_op,
             image_op=image_op,
             forbidden_themes=forbidden_themes
@@ -205,8 +150,10 @@ class PublisherMethods(MethodMixin):
         Returns:
             Bots: Результат обновления.
         """
-        return await self._bots_action(
-            action="update",
+        if not any([bot_token, bot_id, bot_name, bot_nickname]):
+            raise ValueError("You must provide at least one of bot_token, bot_id, bot_name, bot_nickname")
+        return await self._call(
+            ENDPOINTS["update"],
             bot_token=bot_token,
             bot_id=bot_id,
             bot_name=bot_name,
@@ -234,10 +181,9 @@ class PublisherMethods(MethodMixin):
         Returns:
             Bots: Информация о боте.
         """
-        return await self._bots_action(
-            action="info",
-            bot_id=bot_id
-        )
+        if not bot_id:
+            raise ValueError("bot_id is required")
+        return await self._call(ENDPOINTS["get_bot_info"], bot_id=bot_id)
         
     async def get_user_subscriptions(
         self,
@@ -259,22 +205,46 @@ class PublisherMethods(MethodMixin):
         Returns:
             GetSponsors: Статусы подписок (subscribed/unsubscribed).
         """
-        payload = {
-            "user_id": user_id,
-            "links": links,
-            "start_date": start_date.strftime("%Y-%m-%d") if start_date else None,
-            "end_date": end_date.strftime("%Y-%m-%d") if end_date else None
-        }
-        json_data = {k: v for k, v in payload.items() if v is not None}
-        
-        return await self._make_request(
-            method="POST",
-            endpoint="get-user-subscriptions",
-            response_model=GetSponsors,
-            json=json_data,
-            key_type=KeyType.BOT
+        return await self._call(
+            ENDPOINTS["get_user_subscriptions"],
+            user_id=user_id,
+            links=links,
+            start_date=start_date,
+            end_date=end_date
         )
     
+    async def iter_user_subscriptions(
+        self,
+        user_ids: Union[Iterable[int], AsyncIterable[int]],
+        links: Optional[List[str]] = None,
+        start_date: Optional[Union[date, datetime]] = None,
+        end_date: Optional[Union[date, datetime]] = None,
+        concurrency: int = 10,
+        start: int = 0
+    ) -> AsyncIterator[BatchResult[int, GetSponsors]]:
+        """
+        Проверяет подписки множества пользователей (get_user_subscriptions) с ограничением параллельности.
+        Результаты выдаются по мере готовности, ошибки возвращаются для каждого пользователя отдельно.
+        Ограничение частоты запросов клиента (`rate_limit`) соблюдается.
+        Требует `api_key` (ключ бота).
+
+        Args:
+            user_ids: ID пользователей (список, генератор или асинхронный итератор).
+            links: Список ссылок для проверки (опционально).
+            start_date: Начальная дата выборки (если links не передан).
+            end_date: Конечная дата выборки.
+            concurrency: Максимум одновременных запросов.
+            start: Сколько первых пользователей пропустить (значение `checkpoint` прошлого запуска).
+
+        Yields:
+            BatchResult: `key` - ID пользователя, `result` - GetSponsors или `error` - исключение.
+        """
+        async def check(user_id: int) -> GetSponsors:
+            return await self.get_user_subscriptions(user_id, links, start_date, end_date)
+
+        async for item in iter_batch(check, user_ids, concurrency=concurrency, start=start):
+            yield item
+
     async def get_user_info(
         self,
         user_id: int
@@ -289,10 +259,4 @@ class PublisherMethods(MethodMixin):
         Returns:
             GetUserInfo: Данные о пользователе.
         """
-        return await self._make_request(
-            method="POST",
-            endpoint="get-user-info",
-            response_model=GetUserInfo,
-            json={"user_id": user_id},
-            key_type=KeyType.BOT
-        )
\ No newline at end of file
+        return await self._call(ENDPOINTS["get_user_info"], user_id=user_id)
\ No newline at end of file
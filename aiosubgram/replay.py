@@ -0,0 +1,324 @@
+import asyncio
+import gzip
+import itertools
+import json as jsonlib
+import time
+from array import array
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import IO, TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from .base import KeyType
+from .endpoints import ENDPOINTS
+from .transport import Transport, TransportResponse
+
+if TYPE_CHECKING:
+    from .client import SubgramClient
+
+SECRET_FIELDS = frozenset({"api_token", "api_key", "secret_key", "bot_token", "Auth"})
+"""Поля, значения которых заменяются на "***"."""
+
+PERSONAL_FIELDS = frozenset({"first_name", "last_name", "username", "ip_address"})
+"""Персональные поля, значения которых маскируются с сохранением длины."""
+
+ENDPOINT_KEY_TYPES = {endpoint.path: endpoint.key_type for endpoint in ENDPOINTS.values()}
+"""Тип ключа, с которым драйвер повторяет запрос к эндпоинту."""
+
+
+def redact(value: Any, personal: bool = True) -> Any:
+    """Рекурсивно скрывает ключи (и персональные данные, если `personal`)."""
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if key in SECRET_FIELDS and item is not None:
+                result[key] = "***"
+            elif personal and key in PERSONAL_FIELDS and isinstance(item, str):
+                result[key] = "x" * len(item)
+            else:
+                result[key] = redact(item, personal)
+        return result
+    if isinstance(value, list):
+        return [redact(item, personal) for item in value]
+    return value
+
+
+@dataclass
+class CapturedRequest:
+    """Одна пара запрос/ответ из записи трафика."""
+
+    t: float
+    """Время поступления запроса от начала записи (сек)."""
+
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, Any]]
+    json: Optional[Dict[str, Any]]
+    status: int
+    latency: float
+    """Время ответа API (сек)."""
+
+    response: Any
+
+
+def _open(path: str, mode: str) -> IO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_capture(path: str) -> List[CapturedRequest]:
+    """Загружает запись трафика (JSONL, .gz - сжатый)."""
+    with _open(path, "r") as f:
+        return [CapturedRequest(**jsonlib.loads(line)) for line in f if line.strip()]
+
+
+class _RecordingResponse(TransportResponse):
+    def __init__(self, response: TransportResponse):
+        self._response = response
+        self.status = response.status
+        self.headers = response.headers
+        self.body: Any = None
+
+    async def json(self) -> Any:
+        self.body = await self._response.json()
+        return self.body
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        raw = bytearray()
+        async for chunk in self._response.iter_chunks(chunk_size):
+            raw += chunk
+            yield chunk
+        try:
+            self.body = jsonlib.loads(raw)
+        except ValueError:
+            self.body = raw.decode("utf-8", "replace")
+
+
+class RecordingTransport(Transport):
+    """
+    Обертка над транспортом, записывающая пары запрос/ответ в JSONL:
+    время поступления, задержку, параметры и тело ответа. Ключи всегда скрываются,
+    персональные данные маскируются при `redact_personal=True`.
+    Потоковые ответы (iter_statistic_table и т.п.) при записи целиком держатся в памяти.
+    """
+
+    def __init__(self, inner: Transport, path: str, redact_personal: bool = True):
+        """
+        Args:
+            inner (Transport): Реальный транспорт (например, AiohttpTransport).
+            path (str): Файл записи (".gz" - со сжатием).
+            redact_personal (bool): Маскировать имена, юзернеймы и IP. По умолчанию: True.
+        """
+        self.inner = inner
+        self.path = path
+        self.redact_personal = redact_personal
+        self._file = _open(path, "a")
+        self._started = time.monotonic()
+
+    @asynccontextmanager
+    async def request(self, method, url, params=None, json=None, headers=None):
+        arrived = time.monotonic()
+        status = 0
+        recorded = None
+        try:
+            async with self.inner.request(method, url, params=params, json=json, headers=headers) as response:
+                status = response.status
+                recorded = _RecordingResponse(response)
+                yield recorded
+        finally:
+            record = {
+                "t": round(arrived - self._started, 6),
+                "method": method,
+                "endpoint": urlsplit(url).path.lstrip("/"),
+                "params": redact(params, self.redact_personal),
+                "json": redact(json, self.redact_personal),
+                "status": status,
+                "latency": round(time.monotonic() - arrived, 6),
+                "response": redact(recorded.body if recorded is not None else None, self.redact_personal),
+            }
+            self._file.write(jsonlib.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    async def close(self) -> None:
+        self._file.close()
+        await self.inner.close()
+
+
+class ReplayServer:
+    """
+    Локальный HTTP-сервер, отвечающий записанными ответами.
+    Ответы для каждого (метода, эндпоинта) выдаются по кругу с записанной задержкой,
+    умноженной на `latency_scale`.
+    """
+
+    def __init__(self, records: Iterable[CapturedRequest], latency_scale: float = 1.0):
+        self.latency_scale = latency_scale
+        self.served = 0
+        grouped: Dict[Tuple[str, str], List[CapturedRequest]] = {}
+        for record in records:
+            if record.response is not None:
+                grouped.setdefault((record.method, record.endpoint), []).append(record)
+        self._responses = {key: itertools.cycle(items) for key, items in grouped.items()}
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        responses = self._responses.get((request.method, request.match_info["endpoint"]))
+        if responses is None:
+            return web.json_response({"status": "error", "message": "Not recorded"}, status=404)
+        record = next(responses)
+        self.served += 1
+        if record.latency and self.latency_scale:
+            await asyncio.sleep(record.latency * self.latency_scale)
+        return web.json_response(record.response, status=record.status or 200)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Запускает сервер и возвращает его адрес (для `client.API_URL`)."""
+        app = web.Application()
+        app.router.add_route("*", "/{endpoint:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+@dataclass
+class ReplayReport:
+    """Итоги воспроизведения записи."""
+
+    sent: int = 0
+    errors: int = 0
+    """Неудачных запросов, включая get-sponsors через OPMiddleware (она передает такое событие
+    в обработчик, поэтому оно учитывается и в `passed`)."""
+
+    blocked: int = 0
+    """Событий, на которые OPMiddleware ответила клавиатурой ОП."""
+
+    passed: int = 0
+    """Событий, переданных OPMiddleware в обработчик."""
+
+    duration: float = 0.0
+    latencies: array = field(default_factory=lambda: array("d"))
+    lag: array = field(default_factory=lambda: array("d"))
+    """Опоздание отправки относительно расписания (сек)."""
+
+    def percentile(self, q: float, values: Optional[array] = None) -> float:
+        """Перцентиль задержки (0 <= q <= 100)."""
+        values = sorted(self.latencies if values is None else values)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * q / 100))]
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.duration if self.duration else 0.0
+
+
+class _ReplayBot:
+    def __init__(self, bot_id: int, report: ReplayReport):
+        self.id = bot_id
+        self._report = report
+
+    async def send_message(self, *args, **kwargs) -> None:
+        self._report.blocked += 1
+
+
+async def replay_capture(
+    records: Iterable[CapturedRequest],
+    client: "SubgramClient",
+    speed: float = 1.0,
+    middleware: Optional[Any] = None,
+    bot_id: int = 0
+) -> ReplayReport:
+    """
+    Воспроизводит запись с исходными интервалами между запросами, ускоренными в `speed` раз.
+    Запросы get-sponsors при переданной `middleware` (OPMiddleware) проходят через нее
+    как события пользователя, остальные отправляются клиентом напрямую.
+    OPMiddleware перехватывает ошибки API сама, поэтому на время воспроизведения ее запросы
+    get_sponsors оборачиваются, и ошибки попадают в `errors`.
+
+    Args:
+        records: Записанные запросы (load_capture).
+        client: Клиент, направленный на ReplayServer или другой стенд.
+        speed: Ускорение (например, от 1 до 50).
+        middleware: OPMiddleware для прогона get-sponsors.
+        bot_id: `event.bot.id` событий (для OPMiddleware с KeyRouter).
+
+    Returns:
+        ReplayReport: Количество запросов, ошибки, задержки и опоздания.
+    """
+    if speed <= 0:
+        raise ValueError("speed must be positive")
+
+    report = ReplayReport()
+    bot = _ReplayBot(bot_id, report)
+
+    async def handler(event, data) -> None:
+        report.passed += 1
+
+    async def get_sponsors(*args, **kwargs):
+        try:
+            return await original(*args, **kwargs)
+        except Exception:
+            report.errors += 1
+            raise
+
+    async def send(record: CapturedRequest) -> None:
+        started = time.monotonic()
+        try:
+            if middleware is not None and record.endpoint == "get-sponsors" and record.json:
+                payload = record.json
+                user = SimpleNamespace(
+                    id=payload["user_id"], first_name=payload.get("first_name"), username=payload.get("username"),
+                    language_code=payload.get("language_code"), is_premium=payload.get("is_premium")
+                )
+                await middleware(handler, SimpleNamespace(from_user=user, bot=bot), {})
+            else:
+                await client._request_json(
+                    record.method, record.endpoint, ENDPOINT_KEY_TYPES.get(record.endpoint, KeyType.SECRET),
+                    record.params, record.json
+                )
+        except Exception:
+            report.errors += 1
+        finally:
+            report.latencies.append(time.monotonic() - started)
+
+    tasks = []
+    ordered = sorted(records, key=lambda record: record.t)
+    origin = ordered[0].t if ordered else 0.0
+    if middleware is not None:
+        original = middleware._get_sponsors
+        middleware._get_sponsors = get_sponsors
+    start = time.monotonic()
+    try:
+        for record in ordered:
+            due = start + (record.t - origin) / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            report.lag.append(max(0.0, time.monotonic() - due))
+            tasks.append(asyncio.create_task(send(record)))
+            report.sent += 1
+        await asyncio.gather(*tasks)
+    finally:
+        if middleware is not None:
+            del middleware._get_sponsors
+    report.duration = time.monotonic() - start
+    return report
\ No newline at end of file
@@ -0,0 +1,191 @@
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Collection, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+from .base import KeyType
+from .streaming import JsonPath
+from .client import SubgramClient
+from .transport import AiohttpTransport, Transport
+from .upstreams import UpstreamPool
+
+
+@dataclass
+class KeyMetrics:
+    """Счетчики запросов одного ключа."""
+
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class TenantClient(SubgramClient):
+    """
+    Клиент одного бота внутри KeyRouter.
+    Не создает собственную сессию: все запросы идут через общий транспорт роутера.
+    """
+
+    def __init__(self, router: "KeyRouter", bot_id: int, api_key: str, rate_limit: Optional[float] = None):
+        super().__init__(router.secret_key, router.api_token, api_key, router.timeout, rate_limit, router.transport,
+                         router.auth_cooldown, router.upstreams)
+        self.bot_id = bot_id
+        self.metrics = KeyMetrics()
+
+    async def close(self):
+        """Транспортом владеет роутер, закрывать нечего."""
+
+    async def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        key_type: KeyType = KeyType.SECRET,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        idempotent: bool = False
+    ) -> Any:
+        started = time.monotonic()
+        self.metrics.requests += 1
+        try:
+            return await super()._request_json(method, endpoint, key_type, params, json, idempotent)
+        except Exception:
+            self.metrics.errors += 1
+            raise
+        finally:
+            self.metrics.total_latency += time.monotonic() - started
+
+    async def _iter_json(
+        self,
+        method: str,
+        endpoint: str,
+        paths: Collection[JsonPath],
+        key_type: KeyType = KeyType.SECRET,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        chunk_size: int = 65536,
+        idempotent: bool = False
+    ) -> AsyncIterator[Tuple[JsonPath, Any]]:
+        # Ограничение частоты применяется в BaseClient._iter_json; здесь учитываются метрики,
+        # задержка - до конца чтения потока.
+        started = time.monotonic()
+        self.metrics.requests += 1
+        try:
+            async for item in super()._iter_json(
+                method, endpoint, paths, key_type, params, json, chunk_size, idempotent
+            ):
+                yield item
+        except Exception:
+            self.metrics.errors += 1
+            raise
+        finally:
+            self.metrics.total_latency += time.monotonic() - started
+
+
+class KeyRouter:
+    """
+    Мультиарендный клиент: реестр `api_key` по ID бота и один общий пул соединений.
+    Для каждого бота создается легкий TenantClient со своим ограничением частоты и метриками,
+    поэтому процесс с сотнями ботов держит один пул соединений вместо сотен.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Mapping[int, str]] = None,
+        secret_key: Optional[str] = None,
+        api_token: Optional[str] = None,
+        timeout: Optional[float] = 15.0,
+        rate_limit: Optional[float] = None,
+        connection_limit: int = 100,
+        transport: Optional[Transport] = None,
+        auth_cooldown: float = 60.0,
+        api_urls: Optional[Union[Sequence[str], UpstreamPool]] = None
+    ):
+        """
+        Args:
+            keys (Optional[Mapping[int, str]]): ID бота -> API Key бота.
+            secret_key (Optional[str]): Secret Key, общий для всех клиентов.
+            api_token (Optional[str]): API Token, общий для всех клиентов.
+            timeout (Optional[float]): Таймаут запроса в секундах.
+            rate_limit (Optional[float]): Лимит запросов в секунду для каждого ключа по умолчанию.
+            connection_limit (int): Максимум одновременных соединений общего пула. По умолчанию: 100.
+            transport (Optional[Transport]): Общий транспорт. По умолчанию: AiohttpTransport.
+            auth_cooldown (float): Время (сек), в течение которого отклоненный (401) ключ бота
+                не отправляется повторно. По умолчанию: 60.
+            api_urls (Optional[Union[Sequence[str], UpstreamPool]]): Базовые адреса API.
+                Пул общий для всех ботов, поэтому состояние адресов учитывает запросы всех клиентов.
+        """
+        self.secret_key = secret_key
+        self.api_token = api_token
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self.connection_limit = connection_limit
+        self.auth_cooldown = auth_cooldown
+        if api_urls is not None and not isinstance(api_urls, UpstreamPool):
+            api_urls = UpstreamPool(api_urls)
+        self.upstreams: Optional[UpstreamPool] = api_urls
+        self.transport = transport if transport is not None else AiohttpTransport(timeout, connection_limit)
+        self._clients: Dict[int, TenantClient] = {}
+        for bot_id, api_key in (keys or {}).items():
+            self.register(bot_id, api_key)
+
+    async def close(self):
+        await self.transport.close()
+
+    def register(self, bot_id: int, api_key: str, rate_limit: Optional[float] = None) -> TenantClient:
+        """
+        Добавляет (или заменяет) ключ бота.
+
+        Args:
+            bot_id: ID бота (например, aiogram `Bot.id`).
+            api_key: API Key бота.
+            rate_limit: Лимит запросов в секунду для этого ключа. По умолчанию: `rate_limit` роутера.
+
+        Returns:
+            TenantClient: Клиент бота.
+        """
+        client = TenantClient(self, bot_id, api_key, rate_limit if rate_limit is not None else self.rate_limit)
+        self._clients[bot_id] = client
+        return client
+
+    def unregister(self, bot_id: int) -> None:
+        self._clients.pop(bot_id, None)
+
+    def get(self, bot_id: int) -> Optional[TenantClient]:
+        """Возвращает клиент бота или None, если ключ не зарегистрирован."""
+        return self._clients.get(bot_id)
+
+    def resolve(self, bot_id: int) -> TenantClient:
+        """
+        Возвращает клиент бота.
+
+        Raises:
+            KeyError: Если ключ бота не зарегистрирован.
+        """
+        client = self._clients.get(bot_id)
+        if client is None:
+            raise KeyError(f"No api_key registered for bot {bot_id}")
+        return client
+
+    def metrics(self) -> Dict[int, KeyMetrics]:
+        """Метрики по ID бота."""
+        return {bot_id: client.metrics for bot_id, client in self._clients.items()}
+
+    def __getitem__(self, bot_id: int) -> TenantClient:
+        return self.resolve(bot_id)
+
+    def __contains__(self, bot_id: int) -> bool:
+        return bot_id in self._clients
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._clients)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
\ No newline at end of file
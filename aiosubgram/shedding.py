@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Literal, Optional
+
+ShedMode = Literal["cache_only", "sample", "skip"]
+
+
+@dataclass
+class ShedMetrics:
+    """Счетчики решений LoadShedder."""
+
+    checks: int = 0
+    """Всего проверок ОП."""
+
+    overloaded: int = 0
+    """Проверок во время перегрузки."""
+
+    sampled: int = 0
+    """Проверок, выполненных во время перегрузки по выборке (режим "sample")."""
+
+    served_cached: int = 0
+    """Проверок, обслуженных из кеша во время перегрузки."""
+
+    shed: int = 0
+    """Пользователей, пропущенных без проверки."""
+
+
+class LoadShedder:
+    """
+    Сброс нагрузки для OPMiddleware. Отслеживает задержку цикла событий (насколько позже
+    назначенного просыпается фоновая задача) и число одновременных запросов get_sponsors.
+    При превышении порогов вместо нового запроса на каждое событие:
+
+    - "cache_only" - используется только кеш, без записи пользователь пропускается;
+    - "sample" - как "cache_only", но часть пользователей (`sample_rate`) все равно проверяется;
+    - "skip" - ОП не проверяется совсем.
+
+    Задержка растет сразу и снижается плавно, поэтому режим не переключается на каждом замере.
+    """
+
+    def __init__(self, max_lag: float = 0.1, max_in_flight: int = 100, mode: ShedMode = "cache_only",
+                 sample_rate: float = 0.1, probe_interval: float = 0.05):
+        """
+        Args:
+            max_lag (float): Порог задержки цикла событий в секундах. По умолчанию: 0.1.
+            max_in_flight (int): Порог одновременных запросов get_sponsors. По умолчанию: 100.
+            mode (ShedMode): Поведение при перегрузке. По умолчанию: "cache_only".
+            sample_rate (float): Доля проверяемых пользователей в режиме "sample". По умолчанию: 0.1.
+            probe_interval (float): Период замера задержки в секундах. По умолчанию: 0.05.
+        """
+        if mode not in ("cache_only", "sample", "skip"):
+            raise ValueError(f"Unknown mode: {mode}")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        if probe_interval <= 0:
+            raise ValueError("probe_interval must be positive")
+        self.max_lag = max_lag
+        self.max_in_flight = max_in_flight
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.probe_interval = probe_interval
+        self.lag = 0.0
+        """Сглаженная задержка цикла событий (сек)."""
+
+        self.in_flight = 0
+        self.metrics = ShedMetrics()
+        self._monitor: Optional[asyncio.Task] = None
+
+    @property
+    def overloaded(self) -> bool:
+        return self.lag > self.max_lag or self.in_flight >= self.max_in_flight
+
+    async def _watch_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.probe_interval)
+            lag = max(0.0, loop.time() - started - self.probe_interval)
+            self.lag = lag if lag > self.lag else self.lag + 0.3 * (lag - self.lag)
+
+    def start(self) -> None:
+        """Запускает замер задержки (вызывается автоматически при первой проверке)."""
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.get_running_loop().create_task(self._watch_lag())
+
+    async def stop(self) -> None:
+        """Останавливает замер задержки."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+            self._monitor = None
+
+    def _sampled(self, user_id: int) -> bool:
+        # Выборка по ID, а не случайная: один и тот же пользователь либо проверяется, либо нет.
+        return (user_id * 2654435761) % 4294967296 < self.sample_rate * 4294967296
+
+    def admit(self, user_id: int) -> Literal["check", "cache", "skip"]:
+        """
+        Решение для события пользователя: "check" - обычная проверка,
+        "cache" - только кеш, "skip" - пропустить без проверки.
+        """
+        self.start()
+        self.metrics.checks += 1
+        if not self.overloaded:
+            return "check"
+        self.metrics.overloaded += 1
+        if self.mode == "skip":
+            self.metrics.shed += 1
+            return "skip"
+        if self.mode == "sample" and self._sampled(user_id):
+            self.metrics.sampled += 1
+            return "check"
+        return "cache"
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Учитывает запрос get_sponsors в числе одновременных."""
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
\ No newline at end of file
@@ -0,0 +1,31 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .series import StatisticSeries, split_date_range
+    from .store import StatisticStore, StatisticSync
+    from .export import ExportTarget, ExportSummary, export_statistic
+    from .portfolio import BotReport, PortfolioReport, build_portfolio_report
+
+_EXPORTS = {
+    "StatisticSeries": "series",
+    "split_date_range": "series",
+    "StatisticStore": "store",
+    "StatisticSync": "store",
+    "ExportTarget": "export",
+    "ExportSummary": "export",
+    "export_statistic": "export",
+    "BotReport": "portfolio",
+    "PortfolioReport": "portfolio",
+    "build_portfolio_report": "portfolio",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # sqlite3 и модули экспорта загружаются только при обращении.
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
\ No newline at end of file
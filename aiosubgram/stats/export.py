@@ -0,0 +1,199 @@
+import csv
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Sequence, Union
+
+from ..batch import iter_batch
+from ..streaming import STATISTIC_TABLE_PATH
+from ..types.general import TableDataItem
+
+if TYPE_CHECKING:
+    from ..client import SubgramClient
+
+TABLE_COLUMNS = (
+    "action", "target_bot_id", "target_ads_id",
+    "bot_id", "bot_nickname", "subscribers", "value", "is_excluded", "link", "ads_id",
+    "service_subs", "service_value", "own_subs", "own_value",
+)
+"""Колонки выгрузки табличных данных (TableDataItem)."""
+
+SERIES_COLUMNS = ("action", "target_bot_id", "target_ads_id", "label", "subscribers", "value", "avg_price")
+"""Колонки выгрузки графиков (по одной строке на дату)."""
+
+_SERIES_PATHS = [("data", key) for key in ("labels", "subscribers_data", "value_data", "avg_price_data")]
+
+_ARROW_TYPES = {
+    "action": "string", "target_bot_id": "int64", "target_ads_id": "int64",
+    "bot_id": "int64", "bot_nickname": "string", "subscribers": "int64", "value": "float64",
+    "is_excluded": "bool_", "link": "string", "ads_id": "int64",
+    "service_subs": "int64", "service_value": "float64", "own_subs": "int64", "own_value": "float64",
+    "label": "string", "avg_price": "float64",
+}
+
+
+@dataclass(frozen=True)
+class ExportTarget:
+    """Набор статистики для выгрузки."""
+
+    action: Literal["allads", "ads", "source", "allbots", "bots", "sponsor"]
+    bot_id: Optional[int] = None
+    ads_id: Optional[int] = None
+
+
+@dataclass
+class ExportSummary:
+    """Итоги выгрузки."""
+
+    table_rows: int = 0
+    series_rows: int = 0
+    errors: Dict[ExportTarget, Exception] = field(default_factory=dict)
+    """Ошибки по наборам, выгрузка которых не завершилась. Уже записанные строки таких наборов
+    остаются в файлах (их можно отфильтровать по `action`/`target_bot_id`/`target_ads_id`)."""
+
+    @property
+    def failed(self) -> int:
+        """Количество наборов с ошибкой."""
+        return len(self.errors)
+
+
+class _CsvWriter:
+    def __init__(self, path: str, columns: Sequence[str]):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str, columns: Sequence[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from None
+        self._pa = pa
+        self._schema = pa.schema([(name, getattr(pa, _ARROW_TYPES[name])()) for name in columns])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class _BatchedSink:
+    """Накапливает строки и сбрасывает их в writer пачками фиксированного размера."""
+
+    def __init__(self, writer, batch_size: int):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.rows = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.writer.write(self._buffer)
+            self.rows += len(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+def _open_writer(path: str, columns: Sequence[str], format: str):
+    if format == "csv":
+        return _CsvWriter(path, columns)
+    if format == "parquet":
+        return _ParquetWriter(path, columns)
+    raise ValueError(f"Unsupported export format: {format!r}")
+
+
+async def export_statistic(
+    client: "SubgramClient",
+    targets: Iterable[Union[ExportTarget, str]],
+    table_path: Optional[str] = None,
+    series_path: Optional[str] = None,
+    format: Literal["csv", "parquet"] = "csv",
+    start_date: Optional[Union[date, str]] = None,
+    end_date: Optional[Union[date, str]] = None,
+    batch_size: int = 1000,
+    concurrency: int = 4
+) -> ExportSummary:
+    """
+    Выгружает статистику по множеству ботов или заказов в CSV или Parquet.
+    Ответы разбираются потоково (строки `table_data` по одной), без построения дерева GetStatistic,
+    а строки записываются пачками по `batch_size`, поэтому память не зависит от размера ответов.
+    Ошибка одного набора не прерывает выгрузку и сохраняется в `ExportSummary.errors`. Строки,
+    записанные до ошибки (например, до `DecodeError` в оборванном ответе), остаются в файле.
+    Требует `api_token`.
+
+    Args:
+        client: Клиент с `api_token`.
+        targets: Наборы статистики (ExportTarget или строка action, например "allbots").
+        table_path: Файл для табличных данных (None - не выгружать).
+        series_path: Файл для графиков (None - не выгружать).
+        format: "csv" или "parquet" (требует pyarrow).
+        start_date: Начальная дата.
+        end_date: Конечная дата.
+        batch_size: Размер пачки строк при записи.
+        concurrency: Максимум одновременных запросов.
+
+    Returns:
+        ExportSummary: Количество записанных строк и ошибки по наборам.
+    """
+    table = _BatchedSink(_open_writer(table_path, TABLE_COLUMNS, format), batch_size) if table_path else None
+    series = _BatchedSink(_open_writer(series_path, SERIES_COLUMNS, format), batch_size) if series_path else None
+    summary = ExportSummary()
+    paths = ([STATISTIC_TABLE_PATH] if table is not None else []) + (_SERIES_PATHS if series is not None else [])
+
+    async def export_target(target: ExportTarget) -> None:
+        base = {"action": target.action, "target_bot_id": target.bot_id, "target_ads_id": target.ads_id}
+        columns: Dict[str, List] = {}
+        async for path, raw in client._iter_statistic(
+            paths, target.action, target.ads_id, target.bot_id, start_date, end_date
+        ):
+            if path == STATISTIC_TABLE_PATH:
+                row = TableDataItem.model_validate(raw).model_dump()
+                row.update(base)
+                table.add(row)
+            else:
+                columns[path[-1]] = raw
+
+        if series is not None:
+            subscribers = columns.get("subscribers_data") or ()
+            values = columns.get("value_data") or ()
+            prices = columns.get("avg_price_data") or ()
+            for position, label in enumerate(columns.get("labels") or ()):
+                series.add({
+                    **base,
+                    "label": label,
+                    "subscribers": subscribers[position] if position < len(subscribers) else None,
+                    "value": values[position] if position < len(values) else None,
+                    "avg_price": prices[position] if position < len(prices) else None,
+                })
+
+    targets = (ExportTarget(t) if isinstance(t, str) else t for t in targets)
+    try:
+        async for item in iter_batch(export_target, targets, concurrency=concurrency):
+            if not item.ok:
+                summary.errors[item.key] = item.error
+    finally:
+        if table is not None:
+            table.close()
+            summary.table_rows = table.rows
+        if series is not None:
+            series.close()
+            summary.series_rows = series.rows
+    return summary
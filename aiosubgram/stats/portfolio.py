@@ -0,0 +1,170 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ..batch import iter_batch
+from ..types.general import BotBalanceInfo, GetStatistic, StatisticData
+from .series import StatisticSeries, parse_label, split_date_range, to_date
+
+if TYPE_CHECKING:
+    from ..client import SubgramClient
+
+
+@dataclass
+class BotReport:
+    """Итоги по одному боту за период."""
+
+    bot_id: int
+    bot_username: str
+    total_followers: int
+    revenue: float
+    """Текущий доход бота из get_balance."""
+
+    total_subscribers: int = 0
+    total_value: float = 0.0
+    avg_daily_value: float = 0.0
+    last_day_value: float = 0.0
+    day_over_day: float = 0.0
+    """Изменение суммы последнего дня относительно предыдущего."""
+
+    error: Optional[BaseException] = None
+    """Исключение, если статистику бота получить не удалось."""
+
+
+@dataclass
+class PortfolioReport:
+    """Сводный отчет о доходах по всем ботам аккаунта."""
+
+    balance: Optional[float]
+    labels: List[str]
+    """Метки (даты) общего ряда."""
+
+    value: array
+    """Суммарный доход всех ботов по датам."""
+
+    subscribers: array
+    """Суммарное количество подписок всех ботов по датам."""
+
+    day_over_day: array
+    """Изменение суммарного дохода относительно предыдущей даты (первый элемент - 0)."""
+
+    bots: List[BotReport] = field(default_factory=list)
+
+    @property
+    def total_value(self) -> float:
+        return sum(self.value)
+
+    @property
+    def total_subscribers(self) -> int:
+        return sum(self.subscribers)
+
+    @property
+    def failed(self) -> List[BotReport]:
+        return [bot for bot in self.bots if bot.error is not None]
+
+
+def _aggregate(labels: List[str], series: List[Optional[StatisticSeries]]):
+    """Складывает ряды ботов по общим меткам и считает поденные изменения (NumPy, если установлен)."""
+    position = {label: index for index, label in enumerate(labels)}
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        value = np.zeros(len(labels), dtype=np.float64)
+        subscribers = np.zeros(len(labels), dtype=np.int64)
+        for item in series:
+            if item is None or not len(item):
+                continue
+            index = np.fromiter((position[label] for label in item.labels), dtype=np.intp, count=len(item))
+            np.add.at(value, index, np.frombuffer(item.value, dtype=np.float64))
+            np.add.at(subscribers, index, np.frombuffer(item.subscribers, dtype=np.int64))
+        delta = np.diff(value, prepend=value[:1])
+        return array("d", value.tobytes()), array("q", subscribers.tobytes()), array("d", delta.tobytes())
+
+    value = array("d", bytes(8 * len(labels)))
+    subscribers = array("q", bytes(8 * len(labels)))
+    for item in series:
+        if item is None:
+            continue
+        for label, day_value, day_subscribers in zip(item.labels, item.value, item.subscribers):
+            value[position[label]] += day_value
+            subscribers[position[label]] += day_subscribers
+    delta = array("d", [0.0] * min(1, len(value)))
+    delta.extend(current - previous for previous, current in zip(value, value[1:]))
+    return value, subscribers, delta
+
+
+async def build_portfolio_report(
+    client: "SubgramClient",
+    start_date: Union[date, str],
+    end_date: Optional[Union[date, str]] = None,
+    window_days: int = 31,
+    concurrency: Optional[int] = None
+) -> PortfolioReport:
+    """
+    Строит отчет о доходах по всем ботам аккаунта.
+    Список ботов берется из get_balance (`bots_info`), затем статистика `action="bots"` запрашивается
+    одним параллельным раундом: все окна (см. get_statistic_range) всех ботов сразу. Ряды
+    складываются по датам. Ошибки отдельных ботов не прерывают отчет и сохраняются в `BotReport.error`.
+    Требует `api_token`.
+
+    Args:
+        client: Клиент с `api_token`.
+        start_date: Начальная дата периода.
+        end_date: Конечная дата периода (по умолч. сегодня).
+        window_days: Длина окна запроса статистики (см. get_statistic_range).
+        concurrency: Ограничение одновременных запросов. По умолчанию не ограничено:
+            все запросы отправляются сразу (их ограничивает только пул соединений транспорта).
+
+    Returns:
+        PortfolioReport: Сводный отчет.
+    """
+    balance = await client.get_balance()
+    bots: List[BotBalanceInfo] = balance.bots_info or []
+
+    start = to_date(start_date)
+    windows = split_date_range(start, end_date or date.today(), window_days)
+    requests = [(index, window) for index in range(len(bots)) for window in windows]
+
+    async def fetch(request: Tuple[int, Tuple[date, date]]) -> GetStatistic:
+        index, (window_start, window_end) = request
+        return await client.get_statistic("bots", bot_id=bots[index].bot_id,
+                                          start_date=window_start, end_date=window_end)
+
+    parts: List[List[Optional[StatisticData]]] = [[None] * len(windows) for _ in bots]
+    reports: List[BotReport] = [
+        BotReport(bot.bot_id, bot.bot_username, bot.total_followers, bot.revenue) for bot in bots
+    ]
+    async for item in iter_batch(fetch, requests, concurrency=concurrency or max(len(requests), 1)):
+        index, _ = item.key
+        if not item.ok:
+            if reports[index].error is None:
+                reports[index].error = item.error
+            continue
+        parts[index][item.index % len(windows)] = item.result.data
+
+    series: List[Optional[StatisticSeries]] = [None] * len(bots)
+    for index, report in enumerate(reports):
+        if report.error is not None:
+            continue
+        data = series[index] = StatisticSeries.from_data(parts[index])
+        report.total_subscribers = data.total_subscribers
+        report.total_value = data.total_value
+        if len(data):
+            report.avg_daily_value = sum(data.value) / len(data)
+            report.last_day_value = data.value[-1]
+            if len(data) > 1:
+                last, previous = (parse_label(label, start) for label in data.labels[-2:][::-1])
+                # День без точки в ответе считается нулевым.
+                adjacent = last is None or previous is None or (last - previous).days == 1
+                report.day_over_day = data.value[-1] - (data.value[-2] if adjacent else 0.0)
+
+    # Боты могут покрывать разные дни: общая ось упорядочивается по дате, а не по первому появлению,
+    # чтобы разности соседних дней считались между соседними датами.
+    seen = dict.fromkeys(label for item in series if item is not None for label in item.labels)
+    labels = sorted(seen, key=lambda label: parse_label(label, start) or date.max)
+    value, subscribers, delta = _aggregate(labels, series)
+    return PortfolioReport(balance.balance, labels, value, subscribers, delta, reports)
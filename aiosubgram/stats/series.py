@@ -0,0 +1,144 @@
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..types.general import StatisticData
+
+DateLike = Union[date, str]
+
+_LABEL_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%d.%m")
+
+
+def to_date(value: DateLike) -> date:
+    """Приводит дату или строку YYYY-MM-DD к date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def parse_label(label: str, start: date) -> Optional[date]:
+    """
+    Переводит метку графика в дату или возвращает None, если формат не распознан.
+    Метка без года ("%d.%m") относится к первой такой дате не раньше `start`.
+    """
+    for fmt in _LABEL_FORMATS:
+        try:
+            parsed = datetime.strptime(label, fmt).date()
+        except ValueError:
+            continue
+        if fmt == "%d.%m":
+            parsed = parsed.replace(year=start.year)
+            if parsed < start:
+                parsed = parsed.replace(year=start.year + 1)
+        return parsed
+    return None
+
+
+def split_date_range(start_date: DateLike, end_date: DateLike, window_days: int) -> List[Tuple[date, date]]:
+    """
+    Делит период на непересекающиеся окна длиной не более `window_days` дней (границы включительно).
+
+    Args:
+        start_date: Начальная дата.
+        end_date: Конечная дата.
+        window_days: Длина окна в днях.
+
+    Returns:
+        List[Tuple[date, date]]: Пары (начало, конец) в хронологическом порядке.
+    """
+    if window_days < 1:
+        raise ValueError("window_days must be at least 1")
+    start, end = to_date(start_date), to_date(end_date)
+    if start > end:
+        raise ValueError("start_date must not be later than end_date")
+
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start, window_end))
+        start = window_end + timedelta(days=1)
+    return windows
+
+
+class StatisticSeries:
+    """
+    Компактный колоночный временной ряд статистики.
+    Числовые колонки хранятся в `array` (int64/float64), а не в списках Python-объектов.
+    """
+
+    __slots__ = ("labels", "subscribers", "value", "avg_price", "total_subscribers", "total_value")
+
+    def __init__(self):
+        self.labels: List[str] = []
+        """Метки (даты) точек ряда."""
+
+        self.subscribers = array("q")
+        """Количество подписок по датам."""
+
+        self.value = array("d")
+        """Суммы расходов/доходов по датам."""
+
+        self.avg_price = array("d")
+        """Средняя цена подписчика по датам."""
+
+        self.total_subscribers = 0
+        """Итого подписок за период."""
+
+        self.total_value = 0.0
+        """Итого сумма за период."""
+
+    @classmethod
+    def from_data(cls, parts: Iterable[Optional[StatisticData]]) -> "StatisticSeries":
+        """Склеивает данные нескольких окон (в хронологическом порядке) в один ряд."""
+        series = cls()
+        for data in parts:
+            if data is not None:
+                series.extend(data)
+        return series
+
+    def extend(self, data: StatisticData) -> None:
+        """Добавляет в конец ряда точки из StatisticData."""
+        labels = data.labels or []
+        size = len(labels)
+        self.labels.extend(labels)
+        self.subscribers.extend(_column(data.subscribers_data, size, 0))
+        self.value.extend(_column(data.value_data, size, 0.0))
+        self.avg_price.extend(_column(data.avg_price_data, size, 0.0))
+        if data.total_subscribers is not None:
+            self.total_subscribers += data.total_subscribers
+        else:
+            self.total_subscribers += sum(_column(data.subscribers_data, size, 0))
+        if data.total_value is not None:
+            self.total_value += data.total_value
+        else:
+            self.total_value += sum(_column(data.value_data, size, 0.0))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Возвращает числовые колонки как массивы NumPy (без копирования данных).
+        Требует установленный `numpy`.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("to_numpy() requires numpy: pip install numpy") from None
+        return {
+            "labels": np.asarray(self.labels),
+            "subscribers": np.frombuffer(self.subscribers, dtype=np.int64),
+            "value": np.frombuffer(self.value, dtype=np.float64),
+            "avg_price": np.frombuffer(self.avg_price, dtype=np.float64),
+        }
+
+
+def _column(values: Optional[List], size: int, default) -> List:
+    """Выравнивает колонку по количеству меток и заменяет пропуски значением по умолчанию."""
+    values = values or []
+    column = [default if v is None else v for v in values[:size]]
+    if len(column) < size:
+        column.extend([default] * (size - len(column)))
+    return column
@@ -0,0 +1,218 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Iterable, List, Literal, Optional, Set, Tuple
+
+from ..batch import iter_batch
+from .series import DateLike, StatisticSeries, parse_label, split_date_range, to_date
+
+if TYPE_CHECKING:
+    from ..client import SubgramClient
+
+Action = Literal["allads", "ads", "source", "allbots", "bots", "sponsor"]
+Point = Tuple[date, int, float, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statistic_points (
+    action TEXT NOT NULL,
+    bot_id INTEGER NOT NULL,
+    ads_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    subscribers INTEGER NOT NULL,
+    value REAL NOT NULL,
+    avg_price REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (action, bot_id, ads_id, day)
+) WITHOUT ROWID
+"""
+
+_COVERAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS statistic_coverage (
+    action TEXT NOT NULL,
+    bot_id INTEGER NOT NULL,
+    ads_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    PRIMARY KEY (action, bot_id, ads_id, day)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO statistic_points (action, bot_id, ads_id, day, subscribers, value, avg_price, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (action, bot_id, ads_id, day) DO UPDATE SET
+    subscribers = excluded.subscribers,
+    value = excluded.value,
+    avg_price = excluded.avg_price,
+    updated_at = excluded.updated_at
+"""
+
+
+class StatisticStore:
+    """
+    Локальное хранилище дневной статистики в SQLite (режим WAL).
+    Точки хранятся по ключу (action, bot_id, ads_id, день).
+    """
+
+    def __init__(self, path: str = "subgram_statistic.sqlite3"):
+        """
+        Args:
+            path (str): Путь к файлу базы данных.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_COVERAGE_SCHEMA)
+        self._conn.commit()
+
+    def upsert(self, action: Action, points: Iterable[Point], bot_id: Optional[int] = None,
+               ads_id: Optional[int] = None, covered: Optional[Tuple[date, date]] = None) -> int:
+        """
+        Записывает точки (день, подписки, сумма, средняя цена) одной транзакцией.
+        `covered` - запрошенный период: его дни считаются загруженными, даже если API не вернул по ним точек.
+
+        Returns:
+            int: Количество записанных точек.
+        """
+        now = time.time()
+        rows = [
+            (action, bot_id or 0, ads_id or 0, day.isoformat(), subscribers, value, avg_price, now)
+            for day, subscribers, value, avg_price in points
+        ]
+        covered_rows = []
+        if covered is not None:
+            day, last = covered
+            while day <= last:
+                covered_rows.append((action, bot_id or 0, ads_id or 0, day.isoformat()))
+                day += timedelta(days=1)
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.executemany("INSERT OR IGNORE INTO statistic_coverage VALUES (?, ?, ?, ?)", covered_rows)
+        return len(rows)
+
+    def days(self, action: Action, start_date: DateLike, end_date: DateLike, bot_id: Optional[int] = None,
+             ads_id: Optional[int] = None) -> Set[date]:
+        """Возвращает дни периода, для которых в хранилище уже есть данные или которые уже запрашивались."""
+        key = (action, bot_id or 0, ads_id or 0, to_date(start_date).isoformat(), to_date(end_date).isoformat())
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day FROM statistic_points WHERE action = ? AND bot_id = ? AND ads_id = ? "
+                "AND day BETWEEN ? AND ? "
+                "UNION SELECT day FROM statistic_coverage WHERE action = ? AND bot_id = ? AND ads_id = ? "
+                "AND day BETWEEN ? AND ?",
+                key + key
+            ).fetchall()
+        return {date.fromisoformat(day) for day, in rows}
+
+    def query(self, action: Action, start_date: DateLike, end_date: DateLike, bot_id: Optional[int] = None,
+              ads_id: Optional[int] = None) -> StatisticSeries:
+        """Возвращает сохраненный ряд за период без обращения к API."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, subscribers, value, avg_price FROM statistic_points "
+                "WHERE action = ? AND bot_id = ? AND ads_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (action, bot_id or 0, ads_id or 0, to_date(start_date).isoformat(), to_date(end_date).isoformat())
+            ).fetchall()
+
+        series = StatisticSeries()
+        for day, subscribers, value, avg_price in rows:
+            series.labels.append(day)
+            series.subscribers.append(subscribers)
+            series.value.append(value)
+            series.avg_price.append(avg_price)
+        series.total_subscribers = sum(series.subscribers)
+        series.total_value = sum(series.value)
+        return series
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class StatisticSync:
+    """
+    Инкрементальная синхронизация статистики в StatisticStore.
+    Запрашиваются только отсутствующие дни и последние `mutable_days` дней, которые еще могут измениться.
+    """
+
+    def __init__(self, client: "SubgramClient", store: StatisticStore, mutable_days: int = 2,
+                 window_days: int = 31, concurrency: int = 4):
+        """
+        Args:
+            client (SubgramClient): Клиент с `api_token`.
+            store (StatisticStore): Локальное хранилище.
+            mutable_days (int): Сколько последних дней (включая сегодня) перезапрашивать всегда. По умолчанию: 2.
+            window_days (int): Длина окна запроса в днях (см. get_statistic_range). По умолчанию: 31.
+            concurrency (int): Максимум одновременных запросов. По умолчанию: 4.
+        """
+        self.client = client
+        self.store = store
+        self.mutable_days = mutable_days
+        self.window_days = window_days
+        self.concurrency = concurrency
+
+    def _stale_ranges(self, present: Set[date], start: date, end: date) -> List[Tuple[date, date]]:
+        mutable_from = date.today() - timedelta(days=self.mutable_days - 1)
+        ranges: List[Tuple[date, date]] = []
+        day = start
+        while day <= end:
+            if day not in present or day >= mutable_from:
+                if ranges and ranges[-1][1] == day - timedelta(days=1):
+                    ranges[-1] = (ranges[-1][0], day)
+                else:
+                    ranges.append((day, day))
+            day += timedelta(days=1)
+        return ranges
+
+    async def sync(self, action: Action, start_date: DateLike, end_date: Optional[DateLike] = None,
+                   bot_id: Optional[int] = None, ads_id: Optional[int] = None) -> int:
+        """
+        Догружает в хранилище недостающие и изменяемые дни периода.
+
+        Returns:
+            int: Количество записанных точек.
+        """
+        start, end = to_date(start_date), to_date(end_date or date.today())
+        present = await asyncio.to_thread(self.store.days, action, start, end, bot_id, ads_id)
+        windows = [
+            window
+            for range_start, range_end in self._stale_ranges(present, start, end)
+            for window in split_date_range(range_start, range_end, self.window_days)
+        ]
+
+        async def fetch(window: Tuple[date, date]):
+            return await self.client.get_statistic(action, ads_id, bot_id, window[0], window[1])
+
+        written = 0
+        async for item in iter_batch(fetch, windows, concurrency=self.concurrency):
+            if not item.ok:
+                raise item.error
+            window_start, window_end = item.key
+            series = StatisticSeries.from_data([item.result.data])
+            points = [
+                (day, subscribers, value, avg_price)
+                for day, subscribers, value, avg_price in zip(
+                    _label_dates(series.labels, window_start), series.subscribers, series.value, series.avg_price
+                )
+                if window_start <= day <= window_end
+            ]
+            written += await asyncio.to_thread(self.store.upsert, action, points, bot_id, ads_id, item.key)
+        return written
+
+    async def series(self, action: Action, start_date: DateLike, end_date: Optional[DateLike] = None,
+                     bot_id: Optional[int] = None, ads_id: Optional[int] = None) -> StatisticSeries:
+        """Синхронизирует период и возвращает ряд из локального хранилища."""
+        end_date = end_date or date.today()
+        await self.sync(action, start_date, end_date, bot_id, ads_id)
+        return await asyncio.to_thread(self.store.query, action, start_date, end_date, bot_id, ads_id)
+
+
+def _label_dates(labels: List[str], start: date) -> List[date]:
+    """
+    Переводит метки графика в даты. Нераспознанные метки считаются идущими подряд по дням от `start`.
+    """
+    return [parse_label(label, start) or start + timedelta(days=position) for position, label in enumerate(labels)]
\ No newline at end of file
@@ -0,0 +1,216 @@
+import codecs
+import json
+import re
+from typing import Any, Collection, List, Optional, Tuple
+
+JsonPath = Tuple[str, ...]
+
+STATISTIC_TABLE_PATH: JsonPath = ("data", "table_data", "*")
+"""Путь к строкам таблицы в ответе statistic."""
+
+_STRUCT_RE = re.compile(r'["{}\[\]:,]')
+_STRING_RE = re.compile(r'["\\]')
+_CAPTURE_RE = re.compile(r'["{}\[\]]')
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+class JsonPathScanner:
+    """
+    Инкрементальный разбор JSON по частям без построения всего документа.
+
+    Выдает значения-контейнеры (объекты и массивы), путь к которым совпадает с одним из `paths`.
+    Путь - кортеж ключей от корня, элементы массива обозначаются "*". Например,
+    `("data", "table_data", "*")` - каждый элемент массива `data.table_data` по отдельности,
+    а `("data", "labels")` - массив `data.labels` целиком. В памяти хранится только
+    текущее значение и необработанный хвост последнего куска.
+
+    После последнего куска нужно вызвать close(): он проверяет, что документ получен целиком.
+    """
+
+    def __init__(self, paths: Collection[JsonPath]):
+        self.paths = {tuple(path) for path in paths}
+        self._prefixes = {path[:size] for path in self.paths for size in range(len(path))}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[List[Optional[str]]] = []
+        self._in_string = False
+        self._key_start: Optional[int] = None
+        self._expect_key = False
+        self._started = False
+        # Значение, не поместившееся в полученную часть: его куски, путь и глубина вложенности.
+        # Конец ищется только в новых данных, а разбирается значение один раз, когда получено целиком.
+        self._capture: Optional[List[str]] = None
+        self._capture_path: Optional[JsonPath] = None
+        self._capture_depth = 0
+        self._capture_escape = False
+
+    def _scan_capture(self, buf: str, i: int) -> Tuple[int, bool]:
+        """Ищет конец захваченного значения начиная с `i`. Возвращает (позиция, найден ли конец)."""
+        depth = self._capture_depth
+        if self._capture_escape:
+            self._capture_escape = False
+            i += 1
+        while True:
+            if self._in_string:
+                match = _STRING_RE.search(buf, i)
+                if match is None:
+                    i = len(buf)
+                    break
+                j = match.start()
+                if buf[j] == "\\":
+                    if j + 1 >= len(buf):
+                        self._capture_escape = True
+                        i = len(buf)
+                        break
+                    i = j + 2
+                    continue
+                self._in_string = False
+                i = j + 1
+                continue
+
+            match = _CAPTURE_RE.search(buf, i)
+            if match is None:
+                i = len(buf)
+                break
+            j = match.start()
+            char = buf[j]
+            i = j + 1
+            if char == '"':
+                self._in_string = True
+            elif char == "{" or char == "[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._capture_depth = 0
+                    return i, True
+        self._capture_depth = depth
+        return i, False
+
+    def feed(self, chunk: bytes) -> List[Tuple[JsonPath, Any]]:
+        """
+        Принимает очередной кусок тела ответа.
+
+        Returns:
+            List[Tuple[JsonPath, Any]]: Значения, полностью полученные к этому моменту.
+
+        Raises:
+            ValueError: Если тело не является корректным JSON.
+        """
+        text = self._decoder.decode(chunk)
+        out = []
+        if self._capture is not None:
+            end, complete = self._scan_capture(text, 0)
+            keep = self._capture_path in self.paths
+            if not complete:
+                if keep:
+                    self._capture.append(text)
+                return out
+            if keep:
+                self._capture.append(text[:end])
+            self._finish_capture(out)
+            buf, i = text[end:], 0
+        else:
+            buf, i = self._buf + text, self._pos
+        stack = self._stack
+
+        while True:
+
+            if self._in_string:
+                match = _STRING_RE.search(buf, i)
+                if match is None:
+                    i = len(buf)
+                    break
+                j = match.start()
+                if buf[j] == "\\":
+                    if j + 1 >= len(buf):
+                        i = j
+                        break
+                    i = j + 2
+                    continue
+                self._in_string = False
+                i = j + 1
+                if self._key_start is not None:
+                    stack[-1][1] = json.loads(buf[self._key_start:i])
+                    self._key_start = None
+                continue
+
+            match = _STRUCT_RE.search(buf, i)
+            if match is None:
+                i = len(buf)
+                break
+            j = match.start()
+            char = buf[j]
+            i = j + 1
+
+            if char == '"':
+                self._in_string = True
+                if self._expect_key:
+                    self._key_start = j
+            elif char == "{" or char == "[":
+                if not stack:
+                    if self._started:
+                        raise ValueError(f"Extra data at position {j}")
+                    self._started = True
+                path = tuple(key for _, key in stack)
+                if path in self.paths or (char == "{" and path not in self._prefixes):
+                    # Искомое или ненужное значение целиком разбирается C-парсером.
+                    try:
+                        value, i = _raw_decode(buf, j)
+                    except json.JSONDecodeError:
+                        self._capture_path, self._capture_depth = path, 1
+                        end, complete = self._scan_capture(buf, j + 1)
+                        if not complete:
+                            # Значение продолжается в следующих кусках (ненужное значение не хранится).
+                            self._capture = [buf[j:]] if path in self.paths else []
+                            buf, i = "", 0
+                            break
+                        # Значение получено целиком, но не разбирается - тело некорректно.
+                        self._capture = [buf[j:end]]
+                        self._finish_capture(out)
+                        i = end
+                        continue
+                    if path in self.paths:
+                        out.append((path, value))
+                    self._expect_key = False
+                    continue
+                stack.append([char, None if char == "{" else "*"])
+                self._expect_key = char == "{"
+            elif char == "}" or char == "]":
+                if not stack or stack[-1][0] != ("{" if char == "}" else "["):
+                    raise ValueError(f"Unexpected {char!r} at position {j}")
+                stack.pop()
+                self._expect_key = False
+            elif char == ":":
+                self._expect_key = False
+            elif stack and stack[-1][0] == "{":
+                self._expect_key = True
+
+        keep = i if self._key_start is None else min(i, self._key_start)
+        if keep:
+            buf = buf[keep:]
+            i -= keep
+            if self._key_start is not None:
+                self._key_start -= keep
+        self._buf = buf
+        self._pos = i
+        return out
+
+    def _finish_capture(self, out: List[Tuple[JsonPath, Any]]) -> None:
+        path, text = self._capture_path, "".join(self._capture)
+        self._capture = self._capture_path = None
+        self._expect_key = False
+        if path in self.paths:
+            out.append((path, json.loads(text)))
+
+    def close(self) -> None:
+        """
+        Проверяет, что документ завершен: корневое значение закрыто и ничего не осталось недочитанным.
+
+        Raises:
+            ValueError: Если тело оборвано или пусто.
+        """
+        self._buf += self._decoder.decode(b"", final=True)
+        if not self._started or self._stack or self._in_string or self._capture is not None:
+            raise ValueError("Unexpected end of JSON document")
@@ -0,0 +1,178 @@
+import asyncio
+import json as jsonlib
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Mapping, Optional
+
+from .exceptions import DecodeError, NetworkError
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+def decode_json(status: int, raw: bytes) -> Any:
+    """Разбирает тело ответа как JSON независимо от Content-Type; иначе - DecodeError с текстом тела."""
+    try:
+        return jsonlib.loads(raw)
+    except ValueError:
+        text = raw.decode("utf-8", "replace")
+        raise DecodeError(status, f"Response is not valid JSON: {text[:200]!r}", data=text) from None
+
+
+class TransportResponse:
+    """Ответ транспорта: код статуса, заголовки, JSON и потоковое чтение тела."""
+
+    status: int
+    headers: Mapping[str, str] = {}
+
+    async def json(self) -> Any:
+        """Разобранное тело ответа. Raises: DecodeError, если тело - не JSON."""
+        raise NotImplementedError
+
+    def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        raise NotImplementedError
+
+
+class Transport:
+    """
+    HTTP-транспорт клиента. Реализации переводят ошибки своей библиотеки в NetworkError.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """Асинхронный контекстный менеджер, возвращающий TransportResponse."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+
+class _AiohttpResponse(TransportResponse):
+    def __init__(self, response: "aiohttp.ClientResponse"):
+        self._response = response
+        self.status = response.status
+        self.headers = response.headers
+
+    async def json(self) -> Any:
+        return decode_json(self.status, await self._response.read())
+
+    def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        return self._response.content.iter_chunked(chunk_size)
+
+
+class AiohttpTransport(Transport):
+    """Транспорт по умолчанию: aiohttp, HTTP/1.1, одно соединение на каждый одновременный запрос."""
+
+    def __init__(self, timeout: Optional[float] = 15.0, connection_limit: int = 100):
+        """
+        Args:
+            timeout (Optional[float]): Таймаут запроса в секундах.
+            connection_limit (int): Максимум одновременных соединений. По умолчанию: 100.
+        """
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def get_session(self) -> "aiohttp.ClientSession":
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.connection_limit)
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method, url, params=None, json=None, headers=None):
+        import aiohttp
+
+        session = await self.get_session()
+        try:
+            async with session.request(method, url, params=params, json=json, headers=headers) as response:
+                yield _AiohttpResponse(response)
+        except asyncio.TimeoutError:
+            raise NetworkError(f"Request timed out after {self.timeout}s") from None
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network error occurred: {e}")
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+class _HttpxResponse(TransportResponse):
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+
+    async def json(self) -> Any:
+        return decode_json(self.status, await self._response.aread())
+
+    def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        return self._response.aiter_bytes(chunk_size)
+
+
+class HttpxTransport(Transport):
+    """
+    Транспорт на httpx с HTTP/2: одновременные запросы мультиплексируются
+    в несколько соединений вместо отдельного соединения на каждый запрос.
+    Требует `httpx[http2]`.
+    """
+
+    def __init__(self, timeout: Optional[float] = 15.0, http2: bool = True, max_connections: int = 10,
+                 **client_kwargs: Any):
+        """
+        Args:
+            timeout (Optional[float]): Таймаут запроса в секундах.
+            http2 (bool): Использовать HTTP/2. По умолчанию: True.
+            max_connections (int): Максимум соединений в пуле. По умолчанию: 10.
+            **client_kwargs: Дополнительные параметры httpx.AsyncClient
+                (например, `http1=False` для HTTP/2 без TLS).
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("HttpxTransport requires httpx: pip install 'httpx[http2]'") from None
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError("HTTP/2 requires the h2 package: pip install 'httpx[http2]'") from None
+        self._httpx = httpx
+        self.timeout = timeout
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.client_kwargs = client_kwargs
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None or self._client.is_closed:
+            self._client = self._httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=self._httpx.Limits(max_connections=self.max_connections),
+                **self.client_kwargs
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def request(self, method, url, params=None, json=None, headers=None):
+        client = self._get_client()
+        try:
+            async with client.stream(method, url, params=params, json=json, headers=headers) as response:
+                yield _HttpxResponse(response)
+        except self._httpx.TimeoutException:
+            raise NetworkError(f"Request timed out after {self.timeout}s") from None
+        except self._httpx.HTTPError as e:
+            raise NetworkError(f"Network error occurred: {e}")
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
\ No newline at end of file
@@ -5,5 +5,6 @@ class SubgramObject(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
         from_attributes=True,
-        extra='ignore'
+        extra='ignore',
+        defer_build=True
     )
\ No newline at end of file
@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+
+@dataclass
+class Upstream:
+    """Базовый адрес API и его пассивно собранное состояние."""
+
+    url: str
+    latency: Optional[float] = None
+    """EWMA времени ответа (сек); None - запросов еще не было."""
+
+    error_rate: float = 0.0
+    """EWMA доли неудачных запросов (0..1)."""
+
+    failures: int = 0
+    """Неудачных запросов подряд."""
+
+    down_until: float = 0.0
+    """Момент (time.monotonic), до которого адрес исключен из маршрутизации."""
+
+    probing: bool = False
+    """Адрес вернулся после исключения и ждет результата пробного запроса."""
+
+    requests: int = 0
+    errors: int = 0
+    _urls: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def url_for(self, endpoint: str) -> str:
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = f"{self.url}/{endpoint}"
+        return url
+
+    @property
+    def score(self) -> float:
+        """Ожидаемая стоимость запроса: задержка, увеличенная долей ошибок. Меньше - лучше."""
+        return (self.latency or 0.0) / (1.0 - min(self.error_rate, 0.9))
+
+
+class UpstreamPool:
+    """
+    Набор базовых адресов API (региональные адреса, прокси, локальный кэширующий сервис)
+    с пассивной оценкой состояния: EWMA задержки и доли ошибок по реальным запросам.
+    Запрос отправляется на адрес с наименьшей оценкой. После `max_failures` ошибок подряд адрес
+    исключается на `cooldown` секунд, затем снова получает один пробный запрос.
+    """
+
+    def __init__(self, urls: Iterable[str], alpha: float = 0.2, max_failures: int = 3, cooldown: float = 30.0):
+        """
+        Args:
+            urls (Iterable[str]): Базовые адреса (как `BaseClient.API_URL`).
+            alpha (float): Вес нового замера в EWMA (0 < alpha <= 1). По умолчанию: 0.2.
+            max_failures (int): Ошибок подряд до исключения адреса. По умолчанию: 3.
+            cooldown (float): Время исключения адреса (сек). По умолчанию: 30.
+        """
+        self.upstreams = [Upstream(url.rstrip("/")) for url in urls]
+        if not self.upstreams:
+            raise ValueError("at least one url is required")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+
+    def candidates(self) -> List[Upstream]:
+        """
+        Адреса в порядке попыток: доступные по возрастанию оценки,
+        затем исключенные (на случай, если недоступны все).
+
+        Исключенный адрес, у которого истек `cooldown`, получает только один вызывающий код:
+        адрес ставится первым в его списке, а для остальных остается исключенным до результата
+        пробного запроса (или до нового `cooldown`, если результат так и не был записан).
+        Накопленные EWMA при этом сохраняются.
+        """
+        now = time.monotonic()
+        probe, healthy, down = None, [], []
+        for upstream in self.upstreams:
+            if upstream.down_until > now:
+                down.append(upstream)
+            elif upstream.down_until and probe is None:
+                upstream.down_until = now + self.cooldown
+                upstream.probing = True
+                probe = upstream
+            elif upstream.down_until:
+                down.append(upstream)
+            else:
+                healthy.append(upstream)
+        healthy.sort(key=lambda upstream: upstream.score)
+        down.sort(key=lambda upstream: upstream.down_until)
+        return ([probe] if probe else []) + healthy + down
+
+    def record_success(self, upstream: Upstream, latency: float) -> None:
+        upstream.requests += 1
+        upstream.failures = 0
+        if upstream.probing:
+            upstream.probing = False
+            upstream.down_until = 0.0
+        upstream.error_rate -= self.alpha * upstream.error_rate
+        if upstream.latency is None:
+            upstream.latency = latency
+        else:
+            upstream.latency += self.alpha * (latency - upstream.latency)
+
+    def record_failure(self, upstream: Upstream) -> None:
+        upstream.requests += 1
+        upstream.errors += 1
+        upstream.failures += 1
+        upstream.error_rate += self.alpha * (1.0 - upstream.error_rate)
+        if upstream.probing or upstream.failures >= self.max_failures:
+            upstream.probing = False
+            upstream.down_until = time.monotonic() + self.cooldown
+
+    def __len__(self) -> int:
+        return len(self.upstreams)
\ No newline at end of file
@@ -1,4 +1,28 @@
-from .keyboard import create_op_keyboard
-from .middleware import OPMiddleware
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["create_op_keyboard", "OPMiddleware"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .keyboard import create_op_keyboard, clear_keyboard_cache
+    from .middleware import OPMiddleware
+    from .prefetch import SponsorsPrefetcher, PrefetchMiddleware, start_trigger, deep_link_trigger, join_trigger
+
+_EXPORTS = {
+    "create_op_keyboard": "keyboard",
+    "clear_keyboard_cache": "keyboard",
+    "OPMiddleware": "middleware",
+    "SponsorsPrefetcher": "prefetch",
+    "PrefetchMiddleware": "prefetch",
+    "start_trigger": "prefetch",
+    "deep_link_trigger": "prefetch",
+    "join_trigger": "prefetch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    # aiogram импортируется только при обращении к интеграции.
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
\ No newline at end of file
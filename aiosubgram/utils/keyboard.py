@@ -1,4 +1,5 @@
-from typing import Optional, Any
+from collections import OrderedDict
+from typing import Optional, Any, Tuple
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -6,6 +7,38 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from ..client import SubgramClient
 from ..types.publisher import GetSponsors
 
+KEYBOARD_CACHE_SIZE = 1024
+"""Максимальное количество готовых клавиатур в кеше create_op_keyboard."""
+
+_keyboard_cache: "OrderedDict[Tuple, InlineKeyboardMarkup]" = OrderedDict()
+
+
+def clear_keyboard_cache() -> None:
+    """Очищает кеш готовых клавиатур create_op_keyboard."""
+    _keyboard_cache.clear()
+
+
+def _build_keyboard(
+    sponsors: Tuple[Tuple[str, str], ...],
+    texts: dict,
+    done_button_text: Optional[str],
+    row_width: Optional[int]
+) -> InlineKeyboardMarkup:
+    kb_builder = InlineKeyboardBuilder()
+
+    buttons = [
+        InlineKeyboardButton(text=texts[sponsor_type], url=link)
+        for sponsor_type, link in sponsors
+    ]
+    kb_builder.row(*buttons, width=row_width)
+
+    if done_button_text:
+        kb_builder.row(
+            InlineKeyboardButton(text=done_button_text, callback_data="subgram-done")
+        )
+    return kb_builder.as_markup()
+
+
 async def create_op_keyboard(
     sponsors_response: Optional[GetSponsors] = None,
     client: Optional[SubgramClient] = None,
@@ -14,12 +47,18 @@ async def create_op_keyboard(
     smart_link_text: str = "➕ Перейти",
     resource_text: str = "➕ Перейти",
     done_button_text: Optional[str] = "✅ Я подписался!",
+    row_width: Optional[int] = None,
+    use_cache: bool = True,
     **kwargs: Any
 ) -> InlineKeyboardMarkup:
     """
     Генерирует клавиатуру (InlineKeyboardMarkup) для aiogram на основе списка спонсоров.
     Если `sponsors_response` не передан, функция сама сделает запрос к API через `client`.
 
+    Готовые клавиатуры кешируются (до `KEYBOARD_CACHE_SIZE` штук) по набору неподписанных
+    спонсоров (тип, ссылка), текстам кнопок и `row_width`, поэтому для повторяющихся наборов
+    спонсоров возвращается один и тот же объект. Не изменяйте возвращенную клавиатуру на месте.
+
     Args:
         sponsors_response (GetSponsors): Объект ответа от get_sponsors (если уже есть).
         client (SubgramClient): Экземпляр SubgramClient (нужен, если sponsors_response is None).
@@ -28,6 +67,8 @@ async def create_op_keyboard(
         smart_link_text (str): Текст на кнопке для смарт-ссылок.
         resource_text (str): Текст на кнопке для внешних ресурсов.
         done_button_text (Optional[str]): Текст кнопки проверки подписки (callback_data: "subgram-done").
+        row_width (Optional[int]): Кол-во кнопок спонсоров в ряду (1-8). По умолчанию: 8.
+        use_cache (bool): Использовать кеш готовых клавиатур. По умолчанию: True.
         **kwargs (Any): Аргументы для get_sponsors (chat_id, user_id и т.д.), если запрос делается внутри.
 
     Returns:
@@ -35,35 +76,33 @@ async def create_op_keyboard(
     """
     if not sponsors_response:
         sponsors_response = await client.get_sponsors(**kwargs)
-        
-    kb_builder = InlineKeyboardBuilder()
-    
-    buttons = []
-    
-    for sponsor in sponsors_response.sponsors:
-        if sponsor.status != "unsubscribed":
-            continue
-        if sponsor.type == "channel":
-            buttons.append(
-                InlineKeyboardButton(text=channel_text, url=sponsor.link)
-            )
-        elif sponsor.type == "bot":
-            buttons.append(
-                InlineKeyboardButton(text=bot_text, url=sponsor.link)
-            )
-        elif sponsor.type == "smart_link":
-            buttons.append(
-                InlineKeyboardButton(text=smart_link_text, url=sponsor.link)
-            )
-        elif sponsor.type == "resource":
-            buttons.append(
-                InlineKeyboardButton(text=resource_text, url=sponsor.link)
-            )
-    if buttons:
-        kb_builder.row(*buttons)
-
-        if done_button_text:
-            kb_builder.row(
-                InlineKeyboardButton(text=done_button_text, callback_data="subgram-done")
-            )
-        return kb_builder.as_markup()
\ No newline at end of file
+
+    sponsors = tuple(
+        (sponsor.type, sponsor.link)
+        for sponsor in sponsors_response.sponsors
+        if sponsor.status == "unsubscribed"
+    )
+    if not sponsors:
+        return None
+
+    texts = {
+        "channel": channel_text,
+        "bot": bot_text,
+        "smart_link": smart_link_text,
+        "resource": resource_text,
+    }
+
+    if not use_cache:
+        return _build_keyboard(sponsors, texts, done_button_text, row_width)
+
+    key = (sponsors, channel_text, bot_text, smart_link_text, resource_text, done_button_text, row_width)
+    keyboard = _keyboard_cache.get(key)
+    if keyboard is not None:
+        _keyboard_cache.move_to_end(key)
+        return keyboard
+
+    keyboard = _build_keyboard(sponsors, texts, done_button_text, row_width)
+    _keyboard_cache[key] = keyboard
+    if len(_keyboard_cache) > KEYBOARD_CACHE_SIZE:
+        _keyboard_cache.popitem(last=False)
+    return keyboard
@@ -1,18 +1,29 @@
-from types import Optional
+import asyncio
+from contextlib import nullcontext
+from typing import Optional, Union
 from aiogram import BaseMiddleware
+from ..cache import SponsorsCache
 from ..client import SubgramClient
+from ..router import KeyRouter
+from ..shedding import LoadShedder
+from ..types.publisher import GetSponsors
 from .keyboard import create_op_keyboard
+from .prefetch import SponsorsPrefetcher
 
 class OPMiddleware(BaseMiddleware):
-    def __init__(self, client: SubgramClient, max_sponsors: int = 5,
+    def __init__(self, client: Union[SubgramClient, KeyRouter], max_sponsors: int = 5,
                  sub_text: str = "Чтобы получить доступ к боту, подпишитесь:",
                  channel_text: str = "➕ Подписаться", bot_text: str = "➕ Перейти в бота",
                  smart_link_text: str = "➕ Перейти", resource_text: str = "➕ Перейти",
-                 done_button_text: str = "✅ Я подписался!"):
+                 done_button_text: str = "✅ Я подписался!",
+                 cache: Optional[SponsorsCache] = None,
+                 prefetcher: Optional[SponsorsPrefetcher] = None,
+                 shedder: Optional[LoadShedder] = None):
         """Миддлварь для aiogram, которая добавляет клавиатуру с кнопками подписки на каналы, боты, смарт-ссылки и внешние ресурсы.
 
         Args:
-            client (SubgramClient): Экземпляр SubgramClient.
+            client (Union[SubgramClient, KeyRouter]): Экземпляр SubgramClient или KeyRouter. С роутером
+                клиент выбирается по `event.bot.id`, а записи кеша хранятся по (ID бота, ID пользователя).
             max_sponsors (int): Максимальное количество спонсоров. По умолчанию: 5.
             sub_text (str): Текст на кнопке подписки. По умолчанию: "Чтобы получить доступ к боту, подпишитесь:".
             channel_text (str): Текст на кнопке для каналов. По умолчанию: "➕ Подписаться".
@@ -20,7 +31,15 @@ class OPMiddleware(BaseMiddleware):
             smart_link_text (str): Текст на кнопке для смарт-ссылок. По умолчанию: "➕ Перейти".
             resource_text (str): Текст на кнопке для внешних ресурсов. По умолчанию: "➕ Перейти".
             done_button_text (str): Текст на кнопке "Я подписался!". По умолчанию: "✅ Я подписался!"
+            cache (Optional[SponsorsCache]): Кеш ответов get_sponsors. Ответы со статусом "ok" хранятся
+                до истечения TTL, остальные используются один раз. По умолчанию: кеш prefetcher'а или без кеша.
+            prefetcher (Optional[SponsorsPrefetcher]): Предзагрузчик спонсоров. Если для пользователя идет
+                фоновая загрузка, миддлварь дождется ее вместо повторного запроса. Не поддерживается с KeyRouter.
+            shedder (Optional[LoadShedder]): Сброс нагрузки: при задержке цикла событий или избытке
+                одновременных запросов проверки обслуживаются из кеша, по выборке или пропускаются.
         """
+        if isinstance(client, KeyRouter) and prefetcher is not None:
+            raise ValueError("prefetcher is not supported with KeyRouter")
         self.client = client
         self.max_sponsors = max_sponsors
         self.sub_text = sub_text
@@ -29,23 +48,66 @@ class OPMiddleware(BaseMiddleware):
         self.smart_link_text = smart_link_text
         self.resource_text = resource_text
         self.done_button_text = done_button_text
+        self.prefetcher = prefetcher
+        self.cache = cache if cache is not None or prefetcher is None else prefetcher.cache
+        self.shedder = shedder
+
+    async def _cached(self, user, cache_key) -> Optional[GetSponsors]:
+        """Ответ из кеша или уже идущей предзагрузки, без нового запроса."""
+        if self.cache is None:
+            return None
+        sponsors_response = self.cache.get(cache_key)
+        if sponsors_response is None and self.prefetcher is not None:
+            task = self.prefetcher.pending(user.id)
+            if task is not None:
+                sponsors_response = await asyncio.shield(task)
+        if sponsors_response is not None and sponsors_response.status != "ok":
+            self.cache.invalidate(cache_key)
+        return sponsors_response
+
+    async def _get_sponsors(self, client: SubgramClient, user, cache_key):
+        sponsors_response = await self._cached(user, cache_key)
+        if sponsors_response is not None:
+            return sponsors_response
+
+        with self.shedder.track() if self.shedder is not None else nullcontext():
+            sponsors_response = await client.get_sponsors(
+                user.id,
+                user.id,
+                user.first_name,
+                user.username,
+                user.language_code,
+                user.is_premium,
+                max_sponsors=self.max_sponsors
+            )
+        if self.cache is not None and sponsors_response.status == "ok":
+            self.cache.set(cache_key, sponsors_response)
+        return sponsors_response
+
     async def __call__(self, handler, event, data):
         if not hasattr(event, "from_user"):
             return
         try:
-            sponsors_response = await self.client.get_sponsors(
-                event.from_user.id,
-                event.from_user.id,
-                event.from_user.first_name,
-                event.from_user.username,
-                event.from_user.language_code,
-                event.from_user.is_premium,
-                max_sponsors=self.max_sponsors
-            )
+            user = event.from_user
+            if isinstance(self.client, KeyRouter):
+                client, cache_key = self.client.resolve(event.bot.id), (event.bot.id, user.id)
+            else:
+                client, cache_key = self.client, user.id
+            decision = self.shedder.admit(user.id) if self.shedder is not None else "check"
+            if decision == "skip":
+                return await handler(event, data)
+            if decision == "cache":
+                sponsors_response = await self._cached(user, cache_key)
+                if sponsors_response is None:
+                    self.shedder.metrics.shed += 1
+                    return await handler(event, data)
+                self.shedder.metrics.served_cached += 1
+            else:
+                sponsors_response = await self._get_sponsors(client, user, cache_key)
             if sponsors_response.status == "warning":
                 keyboard = await create_op_keyboard(
                     sponsors_response,
-                    self.client,
+                    client,
                     self.channel_text,
                     self.bot_text,
                     self.smart_link_text,
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from aiogram import BaseMiddleware
+from aiogram.types import ChatMemberUpdated, Message, TelegramObject, Update, User
+
+from ..cache import SponsorsCache
+from ..client import SubgramClient
+
+logger = logging.getLogger(__name__)
+
+Trigger = Callable[[TelegramObject], bool]
+
+
+def start_trigger(event: TelegramObject) -> bool:
+    """Срабатывает на команду /start (в том числе с deep link)."""
+    return isinstance(event, Message) and bool(event.text) and event.text.split(maxsplit=1)[0].startswith("/start")
+
+
+def deep_link_trigger(event: TelegramObject) -> bool:
+    """Срабатывает только на /start с параметром (deep link)."""
+    if not start_trigger(event):
+        return False
+    return len(event.text.split(maxsplit=1)) > 1
+
+
+def join_trigger(event: TelegramObject) -> bool:
+    """Срабатывает на вступление пользователя в чат или запуск бота (chat_member / my_chat_member)."""
+    return (
+        isinstance(event, ChatMemberUpdated)
+        and event.new_chat_member.status in ("member", "administrator", "creator")
+        and event.old_chat_member.status not in ("member", "administrator", "creator")
+    )
+
+
+class SponsorsPrefetcher:
+    """
+    Фоновая предзагрузка get_sponsors в SponsorsCache.
+    Одновременно выполняется не более `max_concurrency` запросов, лишние запросы отбрасываются,
+    чтобы предзагрузка не добавляла нагрузку в пиковые моменты.
+    """
+
+    def __init__(self, client: SubgramClient, cache: SponsorsCache, max_sponsors: int = 5,
+                 max_concurrency: int = 10):
+        """
+        Args:
+            client (SubgramClient): Экземпляр SubgramClient.
+            cache (SponsorsCache): Кеш, в который сохраняются результаты.
+            max_sponsors (int): Максимальное количество спонсоров (как в OPMiddleware). По умолчанию: 5.
+            max_concurrency (int): Максимум одновременных фоновых запросов. По умолчанию: 10.
+        """
+        self.client = client
+        self.cache = cache
+        self.max_sponsors = max_sponsors
+        self.max_concurrency = max_concurrency
+        self.scheduled = 0
+        self.dropped = 0
+        self.failed = 0
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    def pending(self, user_id: int) -> Optional[asyncio.Task]:
+        """Возвращает задачу предзагрузки для пользователя, если она еще выполняется."""
+        return self._tasks.get(user_id)
+
+    def prefetch(self, user: User) -> bool:
+        """
+        Запускает фоновую загрузку спонсоров для пользователя.
+
+        Args:
+            user (User): Пользователь Telegram.
+
+        Returns:
+            bool: True, если загрузка запущена; False, если данные уже есть или запрос отброшен.
+        """
+        if user.id in self._tasks or user.id in self.cache:
+            return False
+        if len(self._tasks) >= self.max_concurrency:
+            self.dropped += 1
+            return False
+
+        task = asyncio.create_task(self._fetch(user))
+        self._tasks[user.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(user.id, None))
+        self.scheduled += 1
+        return True
+
+    async def _fetch(self, user: User):
+        try:
+            response = await self.client.get_sponsors(
+                user.id,
+                user.id,
+                user.first_name,
+                user.username,
+                user.language_code,
+                user.is_premium,
+                max_sponsors=self.max_sponsors
+            )
+        except Exception as e:
+            self.failed += 1
+            logger.debug("Sponsors prefetch failed for %s: %s", user.id, e)
+            return None
+        self.cache.set(user.id, response)
+        return response
+
+    async def close(self):
+        """Отменяет все незавершенные загрузки."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class PrefetchMiddleware(BaseMiddleware):
+    def __init__(self, prefetcher: SponsorsPrefetcher, triggers: Sequence[Trigger] = (start_trigger, join_trigger)):
+        """Миддлварь для aiogram, которая запускает предзагрузку спонсоров при срабатывании триггеров
+        и сразу передает событие дальше, не дожидаясь ответа API.
+
+        Args:
+            prefetcher (SponsorsPrefetcher): Экземпляр SponsorsPrefetcher.
+            triggers (Sequence[Trigger]): Функции-триггеры. По умолчанию: (start_trigger, join_trigger).
+        """
+        self.prefetcher = prefetcher
+        self.triggers = tuple(triggers)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        target = event.event if isinstance(event, Update) else event
+        if any(trigger(target) for trigger in self.triggers):
+            if isinstance(target, ChatMemberUpdated):
+                user = target.new_chat_member.user
+            else:
+                user = getattr(target, "from_user", None)
+            if user is not None and not user.is_bot:
+                self.prefetcher.prefetch(user)
+        return await handler(event, data)
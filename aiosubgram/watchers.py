@@ -0,0 +1,465 @@
+import asyncio
+import inspect
+import logging
+import math
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterable, List, Literal, Optional, Set, Tuple
+
+from .client import SubgramClient
+from .types.advertiser import OrderInfoData
+from .types.general import GetBalance
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORDER_INTERVALS: Dict[str, Optional[float]] = {
+    "Moderation": 60.0,
+    "Processing": 30.0,
+    "Stopped": 600.0,
+    "Finished": 1800.0,
+    "Rejected": 1800.0,
+    "Archived": 3600.0,
+}
+"""Базовые интервалы опроса заказа (в секундах) по статусу. None - прекратить отслеживание."""
+
+
+class _TimerWheel:
+    """Хешированное колесо таймеров: ключи с близким сроком попадают в один слот и обрабатываются вместе."""
+
+    def __init__(self, tick: float, size: int = 512):
+        self.tick = tick
+        self.size = size
+        self._slots: List[Dict[Hashable, int]] = [{} for _ in range(size)]
+        self._where: Dict[Hashable, int] = {}
+        self._cursor = 0
+
+    def schedule(self, key: Hashable, delay: float) -> None:
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay / self.tick))
+        slot = (self._cursor + ticks) % self.size
+        self._slots[slot][key] = (ticks - 1) // self.size
+        self._where[key] = slot
+
+    def cancel(self, key: Hashable) -> None:
+        slot = self._where.pop(key, None)
+        if slot is not None:
+            self._slots[slot].pop(key, None)
+
+    def advance(self) -> List[Hashable]:
+        self._cursor = (self._cursor + 1) % self.size
+        slot = self._slots[self._cursor]
+        due = []
+        for key, rounds in list(slot.items()):
+            if rounds:
+                slot[key] = rounds - 1
+            else:
+                due.append(key)
+                del slot[key]
+                del self._where[key]
+        return due
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+
+@dataclass
+class OrderEvent:
+    """Смена статуса заказа."""
+
+    order_id: int
+    old_status: str
+    new_status: str
+    data: OrderInfoData
+    """Актуальная информация о заказе."""
+
+
+@dataclass
+class _OrderState:
+    data: Optional[OrderInfoData] = None
+    interval: float = 0.0
+    polled_at: float = 0.0
+
+
+class _Broadcaster:
+    """Рассылка событий колбэкам и подписчикам асинхронных итераторов."""
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self._callbacks: List[Callable[[Any], Any]] = []
+        # Очередь живет, пока жив ее итератор: брошенная подписка не копит события.
+        self._queues: "weakref.WeakSet[asyncio.Queue]" = weakref.WeakSet()
+
+    def add_callback(self, callback: Callable[[Any], Any]) -> None:
+        self._callbacks.append(callback)
+
+    async def publish(self, event: Any) -> None:
+        for callback in self._callbacks:
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.exception("Watcher callback failed: %s", e)
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def subscribe(self) -> "_Subscription":
+        return _Subscription(self)
+
+
+class _Subscription:
+    """
+    Итератор событий _Broadcaster. Очередь регистрируется при создании итератора, а не при
+    первом `__anext__`, поэтому события между events() и началом чтения не теряются.
+    """
+
+    def __init__(self, broadcaster: _Broadcaster):
+        self._broadcaster = broadcaster
+        self._queue: asyncio.Queue = asyncio.Queue(broadcaster.queue_size)
+        broadcaster._queues.add(self._queue)
+
+    def __aiter__(self) -> "_Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._queue not in self._broadcaster._queues:
+            raise StopAsyncIteration
+        return await self._queue.get()
+
+    async def aclose(self) -> None:
+        """Отписывается от событий."""
+        self._broadcaster._queues.discard(self._queue)
+
+
+class OrderWatcher:
+    """
+    Отслеживает статусы множества заказов и сообщает о переходах
+    (например, Moderation → Processing → Finished).
+
+    Интервал опроса каждого заказа зависит от его статуса и скорости выполнения:
+    остановленные и архивные заказы опрашиваются редко, заказ без прироста `quantity_now`
+    опрашивается все реже, а почти выполненный заказ - чаще. Заказы, срок опроса которых
+    совпадает, собираются в общем слоте колеса таймеров и запрашиваются одной пачкой.
+    """
+
+    def __init__(self, client: SubgramClient, order_ids: Iterable[int] = (),
+                 intervals: Optional[Dict[str, Optional[float]]] = None, tick: float = 1.0,
+                 concurrency: int = 10, min_interval: float = 5.0, max_interval: float = 3600.0,
+                 max_polls: int = 4):
+        """
+        Args:
+            client (SubgramClient): Клиент с `secret_key`.
+            order_ids (Iterable[int]): ID заказов для отслеживания.
+            intervals (Optional[Dict]): Базовые интервалы по статусам (дополняют DEFAULT_ORDER_INTERVALS).
+            tick (float): Шаг колеса таймеров в секундах. По умолчанию: 1.
+            concurrency (int): Максимум одновременных запросов get_order_info. По умолчанию: 10.
+            min_interval (float): Минимальный интервал опроса заказа. По умолчанию: 5.
+            max_interval (float): Максимальный интервал опроса заказа. По умолчанию: 3600.
+            max_polls (int): Максимум одновременно выполняемых опросов (пачек заказов). По умолчанию: 4.
+        """
+        if max_polls < 1:
+            raise ValueError("max_polls must be at least 1")
+        self.client = client
+        self.intervals = {**DEFAULT_ORDER_INTERVALS, **(intervals or {})}
+        self.concurrency = concurrency
+        self.max_polls = max_polls
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._wheel = _TimerWheel(tick)
+        self._orders: Dict[int, _OrderState] = {}
+        self._events = _Broadcaster()
+        self._task: Optional[asyncio.Task] = None
+        self._polls: Set[asyncio.Task] = set()
+        for order_id in order_ids:
+            self.add(order_id)
+
+    def add(self, order_id: int) -> None:
+        """Добавляет заказ в отслеживание (первый опрос - на ближайшем шаге)."""
+        if order_id not in self._orders:
+            self._orders[order_id] = _OrderState()
+            self._wheel.schedule(order_id, 0)
+
+    def remove(self, order_id: int) -> None:
+        """Прекращает отслеживание заказа."""
+        self._orders.pop(order_id, None)
+        self._wheel.cancel(order_id)
+
+    def get(self, order_id: int) -> Optional[OrderInfoData]:
+        """Возвращает последнюю полученную информацию о заказе."""
+        state = self._orders.get(order_id)
+        return state.data if state else None
+
+    def on_transition(self, callback: Callable[[OrderEvent], Any]) -> Callable[[OrderEvent], Any]:
+        """Регистрирует колбэк (обычную или async функцию) на смену статуса. Можно использовать как декоратор."""
+        self._events.add_callback(callback)
+        return callback
+
+    def events(self) -> AsyncIterator[OrderEvent]:
+        """Асинхронный итератор событий смены статуса."""
+        return self._events.subscribe()
+
+    def _next_interval(self, state: _OrderState, data: OrderInfoData) -> Optional[float]:
+        base = self.intervals.get(data.status, self.max_interval)
+        if base is None:
+            return None
+        if data.status != "Processing":
+            return min(max(base, self.min_interval), self.max_interval)
+
+        old = state.data
+        if old is not None and old.status == "Processing" and old.quantity_now == data.quantity_now:
+            interval = max(state.interval, base) * 2
+        else:
+            interval = base
+        if data.quantity_all and data.remains / data.quantity_all < 0.1:
+            interval = min(interval, base / 2)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    async def poll(self, order_ids: Iterable[int]) -> None:
+        """Опрашивает указанные заказы, рассылает события и планирует следующий опрос."""
+        async for item in self.client.iter_order_info(order_ids, concurrency=self.concurrency):
+            state = self._orders.get(item.key)
+            if state is None:
+                continue
+            now = time.monotonic()
+            if not item.ok:
+                logger.warning("Failed to poll order %s: %s", item.key, item.error)
+                self._wheel.schedule(item.key, state.interval or self.min_interval)
+                continue
+
+            data = item.result
+            old = state.data
+            interval = self._next_interval(state, data)
+            state.data, state.interval, state.polled_at = data, interval or 0.0, now
+
+            if interval is None:
+                self.remove(item.key)
+            else:
+                self._wheel.schedule(item.key, interval)
+
+            if old is not None and old.status != data.status:
+                await self._events.publish(OrderEvent(item.key, old.status, data.status, data))
+
+    async def _poll_due(self, due: List[int], slots: asyncio.Semaphore) -> None:
+        async with slots:
+            try:
+                await self.poll(due)
+            except Exception as e:
+                logger.exception("Order watcher poll failed: %s", e)
+                for order_id in due:
+                    state = self._orders.get(order_id)
+                    if state is not None and order_id not in self._wheel:
+                        self._wheel.schedule(order_id, state.interval or self.min_interval)
+
+    async def run(self) -> None:
+        """
+        Основной цикл опроса. Обычно запускается через start().
+        Шаги колеса отсчитываются по часам цикла событий, а каждый опрос выполняется отдельной
+        задачей (не более `max_polls` одновременно), поэтому медленный опрос не задерживает следующие шаги.
+        """
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_polls)
+        next_tick = loop.time() + self._wheel.tick
+        try:
+            while True:
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                while next_tick <= loop.time():
+                    next_tick += self._wheel.tick
+                    due = self._wheel.advance()
+                    if due:
+                        task = asyncio.create_task(self._poll_due(due, slots))
+                        self._polls.add(task)
+                        task.add_done_callback(self._polls.discard)
+        finally:
+            for task in list(self._polls):
+                task.cancel()
+            await asyncio.gather(*self._polls, return_exceptions=True)
+
+    def start(self) -> asyncio.Task:
+        """Запускает цикл опроса в фоновой задаче."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Останавливает цикл опроса."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+
+
+@dataclass
+class BalanceEvent:
+    """Изменение баланса аккаунта или показателей бота."""
+
+    field: Literal["balance", "revenue", "total_followers", "bot_added", "bot_removed"]
+    old: Any
+    new: Any
+    bot_id: Optional[int] = None
+    """ID бота (None для `balance`)."""
+
+    data: Optional[GetBalance] = None
+    """Ответ get_balance, в котором обнаружено изменение."""
+
+    @property
+    def delta(self) -> Optional[float]:
+        if isinstance(self.old, (int, float)) and isinstance(self.new, (int, float)):
+            return self.new - self.old
+        return None
+
+
+_BOT_FIELDS: Tuple[str, ...] = ("revenue", "total_followers")
+
+
+class BalanceWatcher:
+    """
+    Опрашивает get_balance по общему расписанию и сообщает об изменении баланса,
+    дохода (`revenue`) и подписчиков (`total_followers`) ботов.
+    Один опрос обслуживает всех подписчиков процесса: колбэки и итераторы events()
+    не добавляют запросов к API, а одновременные вызовы poll() объединяются в один запрос.
+    """
+
+    def __init__(self, client: SubgramClient, interval: float = 60.0, min_delta: float = 0.0):
+        """
+        Args:
+            client (SubgramClient): Клиент с `api_token`.
+            interval (float): Интервал опроса в секундах. По умолчанию: 60.
+            min_delta (float): Минимальное изменение баланса/дохода для события. Изменение
+                считается от последнего сообщенного значения, поэтому мелкие приращения накапливаются.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.client = client
+        self.interval = interval
+        self.min_delta = min_delta
+        self.latest: Optional[GetBalance] = None
+        """Последний полученный ответ get_balance."""
+
+        self._reported: Dict[Tuple[str, Optional[int]], Any] = {}
+        self._events = _Broadcaster()
+        self._polling: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def shared(cls, client: SubgramClient, interval: float = 60.0, min_delta: float = 0.0) -> "BalanceWatcher":
+        """
+        Общий наблюдатель клиента: сервисы одного процесса получают один и тот же объект,
+        поэтому опрос не дублируется. Параметры применяются только при первом вызове.
+        """
+        # Наблюдатель хранится на самом клиенте: реестр с сильной ссылкой на watcher (а через него -
+        # на клиента) не дал бы клиенту освободиться, а цикл client <-> watcher собирает gc.
+        watcher = client._balance_watcher
+        if watcher is None:
+            watcher = client._balance_watcher = cls(client, interval, min_delta)
+        return watcher
+
+    def on_change(self, callback: Callable[[BalanceEvent], Any]) -> Callable[[BalanceEvent], Any]:
+        """Регистрирует колбэк (обычную или async функцию) на изменения. Можно использовать как декоратор."""
+        self._events.add_callback(callback)
+        return callback
+
+    def events(self) -> AsyncIterator[BalanceEvent]:
+        """Асинхронный итератор событий изменения."""
+        return self._events.subscribe()
+
+    def _changed(self, key: Tuple[str, Optional[int]], value: Any, numeric: bool) -> Optional[Any]:
+        """Возвращает прошлое сообщенное значение, если изменение достаточно для события."""
+        old = self._reported.get(key)
+        if old is None or value is None or old == value:
+            return None
+        if numeric and abs(value - old) < self.min_delta:
+            return None
+        return old
+
+    def _diff(self, data: GetBalance) -> List[BalanceEvent]:
+        events: List[BalanceEvent] = []
+        first = not self._reported
+
+        bots = {bot.bot_id: bot for bot in data.bots_info or ()}
+        values: Dict[Tuple[str, Optional[int]], Any] = {("balance", None): data.balance}
+        for bot_id, bot in bots.items():
+            for name in _BOT_FIELDS:
+                values[(name, bot_id)] = getattr(bot, name)
+
+        if not first:
+            known = {bot_id for (_, bot_id) in self._reported if bot_id is not None}
+            for bot_id in bots.keys() - known:
+                events.append(BalanceEvent("bot_added", None, bots[bot_id], bot_id, data))
+            for bot_id in known - bots.keys():
+                events.append(BalanceEvent("bot_removed", self._reported.get(("revenue", bot_id)), None, bot_id, data))
+                for name in _BOT_FIELDS:
+                    self._reported.pop((name, bot_id), None)
+
+        for key, value in values.items():
+            if self._reported.get(key) is None:
+                self._reported[key] = value
+                continue
+            name, bot_id = key
+            old = self._changed(key, value, numeric=name != "total_followers")
+            if old is not None:
+                events.append(BalanceEvent(name, old, value, bot_id, data))
+                self._reported[key] = value
+        return events
+
+    async def _poll(self) -> List[BalanceEvent]:
+        data = await self.client.get_balance()
+        self.latest = data
+        events = self._diff(data)
+        for event in events:
+            await self._events.publish(event)
+        return events
+
+    async def poll(self) -> List[BalanceEvent]:
+        """
+        Запрашивает баланс, рассылает события и возвращает их.
+        Если опрос уже выполняется, ожидает его результат вместо нового запроса.
+        """
+        if self._polling is None or self._polling.done():
+            self._polling = asyncio.ensure_future(self._poll())
+            # Ошибку получают ожидающие poll(); если их отменили (stop()), задача не должна
+            # оставаться с непрочитанным исключением.
+            self._polling.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return await asyncio.shield(self._polling)
+
+    async def run(self) -> None:
+        """Основной цикл опроса. Обычно запускается через start()."""
+        while True:
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.exception("Balance watcher poll failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        """Запускает цикл опроса в фоновой задаче (повторный вызов не создает второй цикл)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Останавливает цикл опроса."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
\ No newline at end of file
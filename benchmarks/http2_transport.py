@@ -0,0 +1,96 @@
+"""
+Сравнение AiohttpTransport (HTTP/1.1) и HttpxTransport (HTTP/2) на локальном сервере-заглушке.
+
+Сервер (hypercorn, h2c без TLS) отвечает на get-sponsors с искусственной задержкой и считает,
+сколько TCP-соединений открыли клиенты. Требует `pip install hypercorn 'httpx[http2]'`.
+
+    python -m benchmarks.http2_transport --requests 2000 --concurrency 200 --latency 0.05
+"""
+import argparse
+import asyncio
+import time
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from aiosubgram import SubgramClient
+from aiosubgram.transport import AiohttpTransport, HttpxTransport
+
+RESPONSE = (
+    b'{"status": "ok", "code": 200, "message": "ok", "total": 0, '
+    b'"additional": {"sponsors": []}}'
+)
+
+
+class StandInServer:
+    """ASGI-заглушка api.subgram.org."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        self.connections.add(tuple(scope["client"]))
+        while (await receive()).get("more_body"):
+            pass
+        await asyncio.sleep(self.latency)
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": RESPONSE})
+
+
+async def run(name: str, transport, server: StandInServer, url: str, total: int, concurrency: int) -> None:
+    client = SubgramClient(api_key="bench", transport=transport, timeout=60)
+    client.API_URL = url
+    server.connections.clear()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(user_id: int) -> None:
+        async with semaphore:
+            await client.get_sponsors(user_id, user_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(user_id) for user_id in range(total)))
+    elapsed = time.perf_counter() - started
+    await client.close()
+    print(f"{name:<22} {elapsed:8.3f} s {total / elapsed:10.0f} req/s {len(server.connections):6d} connections")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--port", type=int, default=8443)
+    args = parser.parse_args()
+
+    server = StandInServer(args.latency)
+    config = Config()
+    config.bind = [f"127.0.0.1:{args.port}"]
+    config.loglevel = "WARNING"
+    config.keep_alive_max_requests = 10 ** 9  # иначе hypercorn закрывает соединение (GOAWAY) каждые 1000 запросов
+    shutdown = asyncio.Event()
+    serving = asyncio.create_task(serve(server, config, shutdown_trigger=shutdown.wait))
+    await asyncio.sleep(0.5)
+
+    url = f"http://127.0.0.1:{args.port}"
+    try:
+        await run("aiohttp (HTTP/1.1)", AiohttpTransport(connection_limit=args.concurrency), server, url,
+                  args.requests, args.concurrency)
+        await run("httpx (HTTP/2, h2c)", HttpxTransport(http1=False, max_connections=4), server, url,
+                  args.requests, args.concurrency)
+    finally:
+        shutdown.set()
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Время импорта aiosubgram в свежем интерпретаторе (медиана по нескольким запускам).
+
+Сценарий "get_balance" дополнительно включает первую валидацию ответа: схемы моделей
+строятся лениво (defer_build), поэтому их стоимость переносится на первое использование.
+
+    python -m benchmarks.import_time --runs 10
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import aiosubgram": "import aiosubgram",
+    "SubgramClient": "from aiosubgram import SubgramClient",
+    "get_balance (cron)": (
+        "from aiosubgram import SubgramClient\n"
+        "from aiosubgram.types.general import GetBalance\n"
+        "SubgramClient(api_token='x')\n"
+        "GetBalance.model_validate({'status': 'ok', 'code': 200, 'balance': 1.0, 'bots_info': []})"
+    ),
+    "OPMiddleware (aiogram)": "from aiosubgram.utils import OPMiddleware",
+}
+
+TEMPLATE = """
+import time
+_started = time.perf_counter()
+{code}
+print(time.perf_counter() - _started)
+"""
+
+
+def measure(code: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TEMPLATE.format(code=code)], check=True, capture_output=True, text=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    for name, code in SCENARIOS.items():
+        print(f"{name:<24} {measure(code, args.runs) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
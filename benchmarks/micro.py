@@ -0,0 +1,233 @@
+"""
+Микробенчмарки горячих путей: валидация моделей ответов, сборка тел запросов и create_op_keyboard.
+
+Для каждого случая измеряется время одной операции (минимум из нескольких повторов).
+Результаты сравниваются с сохраненной базой (benchmarks/baseline.json); случаи, ставшие
+медленнее более чем на `--threshold`, помечаются как регрессия, и скрипт завершается с кодом 1.
+База зависит от машины: перед сравнением релизов сохраните ее на том же хосте (`--save`).
+Запускается из корня репозитория как модуль (так импортируется aiosubgram из исходников):
+
+    python -m benchmarks.micro                  # сравнить с базой
+    python -m benchmarks.micro --save           # обновить базу
+    python -m benchmarks.micro -k statistic     # только случаи, содержащие "statistic"
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from aiosubgram import SubgramClient
+from aiosubgram.types.advertiser import OrderInfo
+from aiosubgram.types.general import GetStatistic
+from aiosubgram.types.publisher import Bots, GetSponsors
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def sponsors_payload(count: int) -> Dict[str, Any]:
+    return {
+        "status": "warning",
+        "code": 200,
+        "message": "Необходимо подписаться",
+        "total": count,
+        "additional": {"sponsors": [
+            {
+                "ads_id": str(1000 + index),
+                "link": f"https://t.me/+sponsor{index}",
+                "resource_id": str(-1001000000000 - index),
+                "type": ("channel", "bot", "smart_link", "resource")[index % 4],
+                "status": "unsubscribed",
+                "available_now": True,
+                "button_text": "Подписаться",
+                "resource_logo": f"https://api.subgram.org/logo/{index}.jpg",
+                "resource_name": f"Sponsor channel {index}",
+            }
+            for index in range(count)
+        ]},
+    }
+
+
+def statistic_payload(rows: int) -> Dict[str, Any]:
+    days = 30
+    return {
+        "status": "ok",
+        "data": {
+            "labels": [f"2024-01-{day + 1:02d}" for day in range(days)],
+            "subscribers_data": [100 + day for day in range(days)],
+            "value_data": [12.5 + day for day in range(days)],
+            "avg_price_data": [0.12] * days,
+            "total_subscribers": 3435,
+            "total_value": 810.0,
+            "table_data": [
+                {"bot_id": 5000000 + index, "bot_nickname": f"bot_{index}", "subscribers": index % 97,
+                 "value": (index % 97) * 0.11, "is_excluded": index % 13 == 0}
+                for index in range(rows)
+            ],
+        },
+    }
+
+
+ORDER_PAYLOAD = {
+    "status": "ok",
+    "code": 200,
+    "response": {
+        "order_id": 123456, "status": "Processing", "link": "https://t.me/channel", "name": "Order",
+        "ads_type": "channel", "track_unsubscriptions": True, "to_bot_member": 0, "quantity_all": 10000,
+        "quantity_day": 1000, "quantity_now": 4321, "remains": 5679, "is_on": 1, "in_archive": 0,
+        "old_price": 1.5, "real_price": 1.8, "is_lite": 0, "sub_speed": 100,
+        "user_parameters": {"gender": "all", "languages": [1, 2], "countries": [1, 7, 12], "ages": [5, 6]},
+        "order_schedule": {"start_time": "09:00:00", "end_time": "21:00:00", "excluded_days": [6, 7]},
+        "coefficients": {"countries": 1.2, "ages": 1.1, "total": 1.32},
+    },
+}
+
+BOTS_PAYLOAD = {
+    "status": "ok",
+    "result": {
+        "bot_id": 7000000001, "bot_name": "Bot", "bot_nickname": "bot", "status": "active", "is_on": True,
+        "profit": 1234.5, "profit_own_orders": 10.0, "api_key": "x" * 64, "time_purge": 60, "max_sponsors": 5,
+        "get_links": True, "gender_question": False, "age_question": False, "show_quiz": False,
+        "text_op": "Подпишитесь", "forbidden_themes": ["casino", "crypto"],
+    },
+}
+
+
+class _PayloadClient(SubgramClient):
+    """Клиент без сети: _make_request только принимает собранное тело запроса."""
+
+    async def _make_request(self, method, endpoint, response_model, key_type=None, params=None, json=None,
+                            idempotent=False):
+        return None
+
+
+def run_sync(coroutine) -> Any:
+    """Выполняет корутину, которая не ждет ввода-вывода, без цикла событий."""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended")
+
+
+def build_cases() -> Dict[str, Callable[[], Any]]:
+    client = _PayloadClient(secret_key="x", api_token="x", api_key="x")
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    for count in (1, 5, 10):
+        payload = sponsors_payload(count)
+        cases[f"validate.GetSponsors[{count}]"] = lambda payload=payload: GetSponsors.model_validate(payload)
+    for rows in (100, 10_000):
+        payload = statistic_payload(rows)
+        cases[f"validate.GetStatistic[{rows}]"] = lambda payload=payload: GetStatistic.model_validate(payload)
+    cases["validate.OrderInfo"] = lambda: OrderInfo.model_validate(ORDER_PAYLOAD)
+    cases["validate.Bots"] = lambda: Bots.model_validate(BOTS_PAYLOAD)
+
+    cases["payload.get_sponsors"] = lambda: run_sync(client.get_sponsors(
+        123, 123, "Ivan", "ivan", "ru", False, max_sponsors=5, exclude_ads_ids=[1, 2]
+    ))
+    cases["payload.bots_update"] = lambda: run_sync(client.update(
+        bot_id=7000000001, max_sponsors=5, time_purge=60, is_on=True, forbidden_themes=["casino"]
+    ))
+    cases["payload.create_order"] = lambda: run_sync(client.create_order(
+        "https://t.me/channel", "channel", 10000, name="Order", price=1.5,
+        user_parameters={"countries": [1, 7], "ages": [5, 6]}, order_schedule={"start_time": "09:00:00"}
+    ))
+
+    try:
+        from aiosubgram.utils.keyboard import create_op_keyboard
+    except ImportError:
+        print("aiogram is not installed, skipping create_op_keyboard", file=sys.stderr)
+    else:
+        sponsors = GetSponsors.model_validate(sponsors_payload(5))
+        cases["keyboard.create_op_keyboard"] = lambda: run_sync(create_op_keyboard(sponsors, use_cache=False))
+        cases["keyboard.create_op_keyboard[cached]"] = lambda: run_sync(create_op_keyboard(sponsors))
+    return cases
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Время одной операции в секундах (минимум из `repeat` повторов, сборщик мусора отключен, как в timeit)."""
+    func()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(func, repeat, min_time)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds * 1e6:9.2f} us"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", dest="pattern", default="", help="запускать только случаи, содержащие подстроку")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="минимальная длительность одного повтора (с)")
+    parser.add_argument("--threshold", type=float, default=0.3, help="допустимое замедление (0.3 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="сохранить результаты как новую базу")
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["cases"]
+
+    results: Dict[str, float] = {}
+    regressions = []
+    for name, func in build_cases().items():
+        if args.pattern not in name:
+            continue
+        results[name] = seconds = measure(func, args.repeat, args.min_time)
+        line = f"{name:<38} {format_time(seconds)}"
+        previous = baseline.get(name)
+        if previous:
+            change = seconds / previous - 1
+            line += f"  {change:+7.1%}"
+            if change > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        merged = {**baseline, **results}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "cases": merged}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Воспроизведение записанного трафика (RecordingTransport) на локальном ReplayServer.
+
+    python -m benchmarks.replay_load capture.jsonl.gz --speed 10 --middleware
+"""
+import argparse
+import asyncio
+
+from aiosubgram import SubgramClient
+from aiosubgram.cache import SponsorsCache
+from aiosubgram.replay import ReplayServer, load_capture, replay_capture
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("capture")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--middleware", action="store_true", help="прогонять get-sponsors через OPMiddleware")
+    parser.add_argument("--cache-ttl", type=float, default=0, help="TTL SponsorsCache для OPMiddleware (0 - без кеша)")
+    args = parser.parse_args()
+
+    records = load_capture(args.capture)
+    async with ReplayServer(records, latency_scale=args.latency_scale) as server:
+        client = SubgramClient(secret_key="replay", api_token="replay", api_key="replay")
+        client.API_URL = server.url
+        middleware = None
+        if args.middleware:
+            from aiosubgram.utils.middleware import OPMiddleware
+            cache = SponsorsCache(ttl=args.cache_ttl) if args.cache_ttl else None
+            middleware = OPMiddleware(client, cache=cache)
+        report = await replay_capture(records, client, speed=args.speed, middleware=middleware)
+        await client.close()
+
+    print(f"requests:   {report.sent} ({report.errors} errors) in {report.duration:.2f} s, "
+          f"{report.throughput:.0f} req/s at {args.speed}x")
+    print(f"latency:    p50 {report.percentile(50) * 1000:.1f} ms, p95 {report.percentile(95) * 1000:.1f} ms, "
+          f"p99 {report.percentile(99) * 1000:.1f} ms")
+    print(f"send lag:   p99 {report.percentile(99, report.lag) * 1000:.1f} ms")
+    if args.middleware:
+        print(f"middleware: {report.blocked} blocked, {report.passed} passed")
+    print(f"served:     {server.served}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file